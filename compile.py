@@ -1,8 +1,12 @@
 import os
 import sys
 
+from bisect import (
+    bisect_right,
+)
+
 from collections import (
-    deque,
+    defaultdict,
 )
 
 from control_flow import (
@@ -16,8 +20,10 @@ from gen import (
 from typing import (
     Any,
     Dict,
+    Iterator,
     List,
     Optional,
+    Sequence,
     TextIO,
     Tuple,
     Union,
@@ -33,12 +39,17 @@ from instruction import (
     MoveRegisterInstruction,
     DualOpInstruction,
     CompareInstruction,
+    CompareNegativeInstruction,
     LabelInstruction,
     ConditionalBranchInstruction,
     UnconditionalBranchInstruction,
     BranchInstruction,
     BranchLinkInstruction,
     NegationInstruction,
+    SAVE_ARG_REGISTERS,
+    RESTORE_ARG_REGISTERS,
+    PUSH_CALLEE_SAVED_REGISTERS,
+    POP_CALLEE_SAVED_REGISTERS,
 )
 
 from ir3 import (
@@ -70,21 +81,20 @@ from peephole_optimization import (
     PeepholeOptimizer
 )
 
-REGISTERS = ['v1', 'v2', 'v3', 'v4', 'v5']
+REGISTERS = ('v1', 'v2', 'v3', 'v4', 'v5')
+
+# Position of each register in REGISTERS and the register descriptor
+REGISTER_INDEX = {r: i for i, r in enumerate(REGISTERS)}
+
+# Indexed by argument position
+ARG_REGISTERS = ('a1', 'a2', 'a3', 'a4')
 
-ARG_REGISTERS = {
-    0: 'a1',
-    1: 'a2',
-    2: 'a3',
-    3: 'a4',
-}
+# Offset from sp of each argument register saved by SAVE_ARG_REGISTERS,
+# which pushes them in order
+ARG_REGISTER_TO_STACK_OFFSET = {r: i * 4 for i, r in enumerate(ARG_REGISTERS)}
 
-ARG_REGISTER_TO_STACK_OFFSET = {
-    'a1': 0,
-    'a2': 4,
-    'a3': 8,
-    'a4': 12
-}
+# IR3 node types with a left and right operand
+OPERATOR_NODE_TYPES = (BinOp3Node, RelOp3Node)
 
 class Compiler:
     """
@@ -99,11 +109,17 @@ class Compiler:
     ir3_generator: IR3Generator
     control_flow_generator: ControlFlowGenerator
     peephole_optimizer: PeepholeOptimizer
-    address_descriptor: Dict[str, List[str]]
-    register_descriptor: Dict[str, List[str]]
-    instruction_head: Instruction
-    instruction_data_tail: Instruction
-    instruction_tail: Instruction
+    address_descriptor: Dict[str, Dict[str, Any]]
+    register_descriptor: List[Optional[str]]
+    md_var_offsets: Dict[str, int]
+    md_arg_registers: Dict[str, str]
+    md_statements: List[Any]
+    md_required_registers: List[Dict[str, Any]]
+    md_live_intervals: Dict[str, Tuple[int, int]]
+    class_layouts: Dict[str, Dict[str, int]]
+    class_sizes: Dict[str, int]
+    data_lines: List[str]
+    instructions: List[Instruction]
     instruction_count: int
     data_label_count: int
     branch_count: int
@@ -122,12 +138,20 @@ class Compiler:
     control_flow_generator: "ControlFlowGenerator"
     peephole_optimizer: "PeepholeOptimizer"
 
-    address_descriptor: Dict[str, List[str]]
-    register_descriptor: Dict[str, List[str]]
+    address_descriptor: Dict[str, Dict[str, Any]]
+    register_descriptor: List[Optional[str]]
+    md_var_offsets: Dict[str, int]
+    md_arg_registers: Dict[str, str]
 
-    instruction_head: Optional["Instruction"]
-    instruction_data_tail: Optional["Instruction"]
-    instruction_tail: Optional["Instruction"]
+    md_statements: List[Any]
+    md_required_registers: List[Dict[str, Any]]
+    md_live_intervals: Dict[str, Tuple[int, int]]
+
+    class_layouts: Dict[str, Dict[str, int]]
+    class_sizes: Dict[str, int]
+
+    data_lines: List[str]
+    instructions: List["Instruction"]
 
     instruction_count: int
     data_label_count: int
@@ -153,42 +177,78 @@ class Compiler:
 
         self.instruction_count = self.data_label_count = self.branch_count = 0
 
-        self.instruction_head = self.instruction_data_tail = \
-            self.instruction_tail = None
+        self.data_lines = []
+        self.instructions = []
 
         self.address_descriptor = {}
-        self.register_descriptor = {
-            'v1': deque(),
-            'v2': deque(),
-            'v3': deque(),
-            'v4': deque(),
-            'v5': deque(),
+        self.register_descriptor = [None] * len(REGISTERS)
+        self.md_var_offsets = {}
+        self.md_arg_registers = {}
+
+        self.md_statements = []
+        self.md_required_registers = []
+        self.md_live_intervals = {}
+
+        self.class_layouts = {}
+        self.class_sizes = {}
+
+        self._required_registers_handlers = {
+            Assignment3Node: self._get_required_registers_for_assignment,
+            Return3Node: self._get_required_registers_for_return,
+            ClassAttribute3Node: self._get_required_registers_for_class_attribute,
+            ReadLn3Node: self._get_required_registers_for_readln,
+            IfGoTo3Node: self._get_required_registers_for_if_goto,
         }
 
-    def _get_incremented_instruction_count(self) -> int:
-        self.instruction_count += 1
-        return self.instruction_count
+        self._assigned_value_required_registers_handlers = {
+            ClassInstance3Node: self._get_required_registers_for_class_instance,
+            BinOp3Node: self._get_required_registers_for_binop,
+            RelOp3Node: self._get_required_registers_for_relop,
+        }
 
-    def _update_instruction_line_no(self) -> None:
+        self._assignment_handlers = {
+            ClassInstance3Node: self._convert_class_instance_assignment_to_assembly,
+            UnaryOp3Node: self._convert_unary_op_assignment_to_assembly,
+            BinOp3Node: self._convert_binop_assignment_to_assembly,
+            RelOp3Node: self._convert_relop_assignment_to_assembly,
+            MethodCall3Node: self._convert_method_call_assignment_to_assembly,
+        }
 
-        current_instruction = self.instruction_head
+        self._raw_argument_load_handlers = {
+            BasicType.INT: self._load_int_raw_argument,
+            BasicType.STRING: self._load_string_raw_argument,
+            BasicType.BOOL: self._load_bool_raw_argument,
+        }
 
-        old_instruction_count = self.instruction_count
+        self._if_goto_condition_handlers = {
+            str: self._convert_if_goto_identifier_condition_to_assembly,
+            IR3Node: self._convert_if_goto_attribute_condition_to_assembly,
+            RelOp3Node: self._convert_if_goto_relop_condition_to_assembly,
+        }
 
-        self.instruction_count = 0
+        self._stmt_handlers = {
+            ReadLn3Node: self._convert_readln_stmt,
+            PrintLn3Node: self._convert_println_stmt,
+            Assignment3Node: self._convert_assignment_stmt,
+            Return3Node: self._convert_return_stmt,
+            Label3Node: self._convert_label_stmt,
+            IfGoTo3Node: self._convert_if_goto_stmt,
+            GoTo3Node: self._convert_goto_stmt,
+        }
 
-        completed = False
+    def _update_instruction_line_no(self) -> None:
 
-        while not completed:
+        old_instruction_count = self.instruction_count
 
-            if not current_instruction:
-                completed = True
-                break
+        # Number the instructions with a local counter and write the
+        # attribute directly, as this runs over every emitted instruction.
+        # Data directives come first and are counted but hold no number.
+        line_no = len(self.data_lines)
 
-            self.instruction_count += 1
-            current_instruction.set_instruction_line_no(self.instruction_count)
+        for line_no, current_instruction in enumerate(self.instructions, line_no + 1):
+            current_instruction.line_no = line_no
 
-            current_instruction = current_instruction.child
+        self.instruction_count = line_no
 
         if self.debug or self.verbose:
             sys.stdout.write("Updating instruction line numbers.\n")
@@ -200,17 +260,36 @@ class Compiler:
         instructions: List["Instructions"]
     ) -> None:
 
-        for i in range(0, len(instructions)-1):
+        # Walk the sequence once, carrying the previous instruction along
+        # and writing the links directly rather than through the setters
 
-            current_instruction = instructions[i]
-            next_instruction = instructions[i+1]
+        instruction_iterator = iter(instructions)
+        current_instruction = next(instruction_iterator, None)
 
-            if self.debug:
+        for next_instruction in instruction_iterator:
+
+            if __debug__ and self.debug:
                 sys.stdout.write("Linking instructions: " + str(current_instruction.line_no) + \
                 " - " + str(next_instruction.line_no) + "\n")
 
-            current_instruction.set_child(next_instruction)
-            next_instruction.set_parent(current_instruction)
+            current_instruction.child = next_instruction
+            next_instruction.parent = current_instruction
+
+            current_instruction = next_instruction
+
+    def _append_instructions(
+        self,
+        instruction: "Instruction",
+        instructions: List["Instruction"]
+    ) -> None:
+
+        # Append a chain of instructions to a flat list in order
+
+        current_instruction = instruction
+
+        while current_instruction:
+            instructions.append(current_instruction)
+            current_instruction = current_instruction.child
 
     def _declare_new_variable(
         self,
@@ -218,60 +297,64 @@ class Compiler:
         offset: int
     ) -> None:
 
-        if self.debug:
+        if __debug__ and self.debug:
             sys.stdout.write("Adding new variable to address descriptor: " + \
                 variable_name + "\n")
 
         self.address_descriptor[variable_name] = {
-            'offset': offset,
-            'references': deque()
+            'references': set()
         }
 
-        if self.debug:
+        # Offsets are fixed for the rest of the method, so they are kept
+        # only in a flat map for the many lookups during code generation
+        self.md_var_offsets[variable_name] = offset
+
+        if __debug__ and self.debug:
             sys.stdout.write("Current address descriptor: " + \
                 str(self.address_descriptor) + "\n")
 
     def _get_variable_offset(self, identifier: str) -> Optional[int]:
 
-        try:
-            offset = self.address_descriptor[identifier]['offset']
+        return self.md_var_offsets.get(identifier)
 
-        except:
+    def _build_class_layouts(self, class_data: "CData3Node") -> None:
 
-            offset = None
+        # Precompute attribute offsets and object sizes for every class so
+        # that lookups during code generation are single dict accesses.
+        # The first declaration of a class or attribute takes precedence.
 
-        return offset
+        self.class_layouts = {}
+        self.class_sizes = {}
 
-    def _get_space_required_for_object(self, class_name: str) -> Optional[int]:
+        current_class_data = class_data
 
-        if self.debug:
-            sys.stdout.write("Calculating space required for object of class: " + \
-                class_name + "\n")
+        while current_class_data:
 
-        completed = False
-        current_class_data = self.ir3_generator.ir3_tree.head.class_data
+            class_name = current_class_data.class_name
 
-        while not completed:
+            # Get identifiers of class attributes
+            object_attributes = current_class_data.get_var_decl_identifiers()
 
-            if not current_class_data:
-                completed = True
-                break
+            if __debug__ and self.debug:
+                sys.stdout.write("Building class layout - " + class_name + \
+                    " - all vars: " + str(object_attributes) + "\n")
 
-            if self.debug:
-                sys.stdout.write("Calculating space required for object - Checking class: " + \
-                    current_class_data.class_name + "\n")
+            class_layout = self.class_layouts.setdefault(class_name, {})
 
-            if class_name == current_class_data.class_name:
+            for i, a in enumerate(object_attributes):
+                class_layout.setdefault(a, i * 4)
 
-                # Get identifiers of class attributes
+            self.class_sizes.setdefault(class_name, len(object_attributes) * 4)
 
-                object_attributes = current_class_data.get_var_decl_identifiers()
+            current_class_data = current_class_data.child
 
-                return len(object_attributes) * 4
+    def _get_space_required_for_object(self, class_name: str) -> Optional[int]:
 
-            current_class_data = current_class_data.child
+        if __debug__ and self.debug:
+            sys.stdout.write("Calculating space required for object of class: " + \
+                class_name + "\n")
 
-        return None
+        return self.class_sizes.get(class_name)
 
     def _calculate_class_attribute_offset(
         self,
@@ -280,126 +363,118 @@ class Compiler:
         attribute_name: Optional[str]=None
     ) -> Optional[int]:
 
-        if type(ir3_node) == ClassAttribute3Node:
+        if type(ir3_node) is ClassAttribute3Node:
 
             attribute_name = ir3_node.target_attribute
             class_name = ir3_node.class_name
 
-        try:
+        class_layout = self.class_layouts.get(class_name)
+
+        if class_layout is None:
+            return None
 
-            completed = False
-            current_class_data = self.ir3_generator.ir3_tree.head.class_data
+        return class_layout.get(attribute_name)
 
-            while not completed:
+    def _get_md_statements(
+        self,
+        ir3_node: CMtd3Node
+    ) -> List[Any]:
 
-                if not current_class_data:
-                    completed = True
-                    break
+        # Materialise the linked list of statements once per method so that
+        # subsequent passes can iterate or index it directly
 
-                if class_name == current_class_data.class_name:
+        statements = []
 
-                    # Get identifiers of class attributes
+        current_stmt = ir3_node.statements
 
-                    object_attributes = current_class_data.get_var_decl_identifiers()
+        while current_stmt:
+            statements.append(current_stmt)
+            current_stmt = current_stmt.child
 
-                    if self.debug:
+        return statements
 
-                        sys.stdout.write("Getting class attribute offset - all vars: " + \
-                            str(object_attributes) + "\n")
+    def _get_method_label(self, method_id: str) -> str:
 
-                    offset = 0
+        # Method temp ids carry a '%' prefix in IR3 that is not valid in
+        # an assembly label, e.g. %Dummy_0 is emitted as Dummy_0
 
-                    for a in object_attributes:
+        if method_id.startswith("%"):
+            return method_id[1:]
 
-                        if a == attribute_name:
-                            return offset
+        return method_id
 
-                        offset += 4
+    def _get_md_arg_registers(
+        self,
+        md_args: List[str]
+    ) -> Dict[str, str]:
 
-                current_class_data = current_class_data.child
+        # Map each argument name to the register it is passed in, keeping
+        # the first occurrence. Arguments beyond the argument registers are
+        # not mapped.
 
-        except:
-            return None
+        md_arg_registers = {}
+
+        for arg, arg_register in zip(md_args, ARG_REGISTERS):
+            md_arg_registers.setdefault(arg[0], arg_register)
+
+        return md_arg_registers
 
     def _get_md_liveness_data(
         self,
-        ir3_node: CMtd3Node,
-        md_args: List[str]
+        ir3_node: CMtd3Node
     ) -> Dict[str, List[int]]:
 
         # Helper function to get live ranges for linear scan register allocation
 
-        if self.debug:
+        if __debug__ and self.debug:
             sys.stdout.write("Getting liveness data for method: " + \
                 str(ir3_node.method_id) + "\n")
 
-        liveness_data = {}
+        # Line numbers are appended in ascending order, which the register
+        # allocator relies on to bisect the lists and read the last use
+        liveness_data = defaultdict(list)
 
-        completed = False
-        current_stmt = ir3_node.statements
+        md_arg_registers = self.md_arg_registers
 
-        while not completed:
+        for md_line_no, current_stmt in enumerate(self.md_statements, 1):
 
-            if not current_stmt:
-                completed = True
-                break
+            current_stmt_type = type(current_stmt)
 
             # Check for statements
-            if type(current_stmt) == Assignment3Node:
+            if current_stmt_type is Assignment3Node:
 
                 identifier = current_stmt.identifier
 
-                identifier_is_arg = self._check_if_in_arguments(
-                    identifier,
-                    md_args
-                )
+                identifier_is_arg = md_arg_registers.get(identifier)
 
                 if not identifier_is_arg:
-                    if identifier in liveness_data:
-                        liveness_data[identifier].append(current_stmt.md_line_no)
-
-                    else:
-                        liveness_data[identifier] = [current_stmt.md_line_no]
+                    liveness_data[identifier].append(md_line_no)
 
                 assigned_value = current_stmt.assigned_value
                 assigned_value_is_raw_value = current_stmt.assigned_value_is_raw_value
 
-                if isinstance(assigned_value, IR3Node) == True:
+                if isinstance(assigned_value, IR3Node):
 
-                    if type(assigned_value) in [BinOp3Node, RelOp3Node]:
+                    if type(assigned_value) in OPERATOR_NODE_TYPES:
 
                         left_operand = assigned_value.left_operand
                         right_operand = assigned_value.right_operand
 
                         if not assigned_value.left_operand_is_raw_value:
 
-                            left_operand_is_non_arg_id = not self._check_if_in_arguments(
-                                left_operand,
-                                md_args
-                            )
+                            left_operand_is_non_arg_id = not md_arg_registers.get(left_operand)
 
                             if left_operand_is_non_arg_id:
 
-                                if left_operand in liveness_data:
-                                    liveness_data[left_operand].append(current_stmt.md_line_no)
-
-                                else:
-                                    liveness_data[left_operand] = [current_stmt.md_line_no]
+                                liveness_data[left_operand].append(md_line_no)
 
                         if not assigned_value.right_operand_is_raw_value:
 
-                            right_operand_is_non_arg_id = not self._check_if_in_arguments(
-                                right_operand,
-                                md_args
-                            )
+                            right_operand_is_non_arg_id = not md_arg_registers.get(right_operand)
 
                             if right_operand_is_non_arg_id:
 
-                                if right_operand in liveness_data:
-                                    liveness_data[right_operand].append(current_stmt.md_line_no)
-
-                                else:
-                                    liveness_data[right_operand] = [current_stmt.md_line_no]
+                                liveness_data[right_operand].append(md_line_no)
 
                     else:
                         # Base IR3Node
@@ -407,69 +482,60 @@ class Compiler:
                         assigned_value = assigned_value.value
 
                         if not assigned_value_is_raw_value:
-                            assigned_value_is_non_arg_id = not self._check_if_in_arguments(
-                                assigned_value,
-                                md_args
-                            )
+                            assigned_value_is_non_arg_id = not md_arg_registers.get(assigned_value)
 
                             if assigned_value_is_non_arg_id:
 
-                                if assigned_value in liveness_data:
-                                    liveness_data[assigned_value].append(current_stmt.md_line_no)
-
-                                else:
-                                    liveness_data[assigned_value] = [current_stmt.md_line_no]
+                                liveness_data[assigned_value].append(md_line_no)
 
                 else:
 
                     if not assigned_value_is_raw_value:
-                        assigned_value_is_non_arg_id = not self._check_if_in_arguments(
-                            assigned_value,
-                            md_args
-                        )
+                        assigned_value_is_non_arg_id = not md_arg_registers.get(assigned_value)
 
                         if assigned_value_is_non_arg_id:
 
-                            if assigned_value in liveness_data:
-                                liveness_data[assigned_value].append(current_stmt.md_line_no)
-
-                            else:
-                                liveness_data[assigned_value] = [current_stmt.md_line_no]
+                            liveness_data[assigned_value].append(md_line_no)
 
-            elif type(current_stmt) == PrintLn3Node:
+            elif current_stmt_type is PrintLn3Node:
 
                 expression = current_stmt.expression
 
-                if self.debug:
+                if __debug__ and self.debug:
                     sys.stdout.write("Getting liveness data for println: " + \
                         str(expression) + "\n")
 
                 if not current_stmt.is_raw_value:
 
-                    if self.debug:
+                    if __debug__ and self.debug:
                         sys.stdout.write("Getting liveness data - println is not raw value.\n")
 
-                    expression_is_non_arg_id = not self._check_if_in_arguments(
-                        expression,
-                        md_args
-                    )
+                    expression_is_non_arg_id = not md_arg_registers.get(expression)
 
-                    if self.debug:
+                    if __debug__ and self.debug:
                         sys.stdout.write("Getting liveness data - println is not arg: " + \
                             str(expression_is_non_arg_id) + "\n")
 
 
                     if expression_is_non_arg_id:
 
-                        if expression in liveness_data:
-                            liveness_data[expression].append(current_stmt.md_line_no)
+                        liveness_data[expression].append(md_line_no)
 
-                        else:
-                            liveness_data[expression] = [current_stmt.md_line_no]
+        return dict(liveness_data)
 
-            current_stmt = current_stmt.child
+    def _get_md_live_intervals(
+        self,
+        liveness_data: Dict[str, List[int]]
+    ) -> Dict[str, Tuple[int, int]]:
 
-        return liveness_data
+        # Collapse the liveness data into a (first use, last use) interval
+        # per identifier so the allocator can check whether a value is
+        # still live without scanning its references
+
+        return {
+            identifier: (line_nos[0], line_nos[-1])
+            for identifier, line_nos in liveness_data.items()
+        }
 
     def _check_if_in_register(
         self,
@@ -477,64 +543,77 @@ class Compiler:
         excluded_registers: List[str]=[]
     ) -> Optional[List[Any]]:
 
-        if self.debug:
+        if __debug__ and self.debug:
 
             sys.stdout.write("Checking if identifier in register.\n")
             sys.stdout.write("Current address_descriptor: " + \
                 str(self.address_descriptor) + "\n")
 
-        try:
-            x_address_descriptor = self.address_descriptor[identifier]['references']
-            is_in_register = [i for i in REGISTERS if i in x_address_descriptor and \
-                i not in excluded_registers]
+        x_address_data = self.address_descriptor.get(identifier)
+
+        if not x_address_data:
+            return None
 
-            if len(is_in_register) == 0:
-                return None
+        # The address descriptor already maps the identifier to where its
+        # value is held, usually in one place or none, so walk its references
+        # instead of probing every register. The register that comes first
+        # in REGISTERS wins, as callers only use the first register found.
 
-        except:
+        register_index = None
+
+        for r in x_address_data['references']:
+
+            r_index = REGISTER_INDEX.get(r)
 
-            is_in_register = None
+            if r_index is not None and r not in excluded_registers and \
+                (register_index is None or r_index < register_index):
 
-        return is_in_register
+                register_index = r_index
+
+        if register_index is None:
+            return None
+
+        return [REGISTERS[register_index]]
 
     def _check_if_in_arguments(
         self,
-        identifier: str,
-        md_args: List[str]
+        identifier: str
     ) -> Optional[str]:
 
-        if self.debug:
+        if __debug__ and self.debug:
                 sys.stdout.write("Checking if identifier [" + str(identifier) + \
-                    "] is in arguments: " + str(md_args) + "\n")
-
-        arg_index = [i for i in range(len(md_args)) if md_args[i][0] == identifier]
-
-        if len(arg_index) > 0:
-            arg_register = ARG_REGISTERS[arg_index[0]]
-
-            return arg_register
+                    "] is in arguments: " + str(self.md_arg_registers) + "\n")
 
-        else:
-            return None
+        return self.md_arg_registers.get(identifier)
 
     def _check_for_empty_register(
         self,
         excluded_registers: List[str]
     ) -> Optional[str]:
 
-        for k, v in self.register_descriptor.items():
+        if not excluded_registers:
+            for k, v in zip(REGISTERS, self.register_descriptor):
+
+                if v is None:
+
+                    if __debug__ and self.debug:
+                        sys.stdout.write("Empty register found: " + \
+                            str(k) + "\n")
+
+                    return k
 
-            if k not in excluded_registers:
+        else:
+            for k, v in zip(REGISTERS, self.register_descriptor):
 
-                if len(v) == 0:
+                if v is None and k not in excluded_registers:
 
-                    if self.debug:
+                    if __debug__ and self.debug:
                         sys.stdout.write("Empty register found: " + \
                             str(k) + "\n")
 
                     return k
 
-        if self.debug:
+        if __debug__ and self.debug:
             sys.stdout.write("No empty registers available.\n")
 
         return None
@@ -544,107 +623,95 @@ class Compiler:
         excluded_registers: List[str]
     ) -> Optional[str]:
 
-        if self.debug:
+        if __debug__ and self.debug:
             sys.stdout.write("Getting register - Check #1 Alternative locations.\n")
 
-        for k, v in self.register_descriptor.items():
-
-            if k not in excluded_registers:
+        address_descriptor = self.address_descriptor
 
-                for r in v:
+        for k, v in zip(REGISTERS, self.register_descriptor):
 
-                    # Check each reference and see if there is an alternative location
+            if v is not None and k not in excluded_registers:
 
-                    try:
-                        if len(self.address_descriptor[r]['references']) > 1:
+                # Check the reference and see if there is an alternative location
 
-                            if self.debug:
-                                sys.stdout.write("Getting register - Check #1 Alternative locations passed.\n")
+                v_address_data = address_descriptor.get(v)
 
-                            return k
+                if v_address_data and len(v_address_data['references']) > 1:
 
-                    except:
-                        pass
+                    if __debug__ and self.debug:
+                        sys.stdout.write("Getting register - Check #1 Alternative locations passed.\n")
 
+                    return k
 
         return None
 
     def _check_for_no_subsequent_use(
         self,
-        identifier: str,
         current_line_no: int,
-        liveness_data: Dict[str, List[int]],
         excluded_registers: List[str]
     ) -> Optional[str]:
 
-        if self.debug:
-            sys.stdout.write("Checking register for subsequent use - liveness data received - " + \
-                str(liveness_data) + "\n")
+        if __debug__ and self.debug:
+            sys.stdout.write("Checking register for subsequent use - live intervals - " + \
+                str(self.md_live_intervals) + "\n")
             sys.stdout.write("Checking register for subsequent use - Address descriptor - " + \
                 str(self.address_descriptor) + "\n")
             sys.stdout.write("Checking register for subsequent use - Register descriptor - " + \
                 str(self.register_descriptor) + "\n")
 
-        for k, v in self.register_descriptor.items():
+        md_live_intervals = self.md_live_intervals
 
-            if k not in excluded_registers:
+        for k, v in zip(REGISTERS, self.register_descriptor):
 
-                for r in v:
+            # Skip registers holding values without liveness data, e.g.
+            # class attributes
+            if v is not None and k not in excluded_registers and \
+                v in md_live_intervals:
 
-                    try:
-                        # Try/except to handle key errors for class attributes
-                        current_register_value_last_use = max([max(liveness_data[r]) for r in v])
+                current_register_value_last_use = md_live_intervals[v][1]
 
-                        if current_line_no > current_register_value_last_use:
+                if current_line_no > current_register_value_last_use:
 
-                            if self.debug:
-                                sys.stdout.write("Value in register not used subsequently. Register found: " + \
-                                    str(k) + "\n")
-
-                            return k
+                    if __debug__ and self.debug:
+                        sys.stdout.write("Value in register not used subsequently. Register found: " + \
+                            str(k) + "\n")
 
-                    except:
-                        pass
+                    return k
 
         return None
 
-    def _check_for_equivalent_register(
+    def _get_spill_cost(
         self,
-        identifier: str,
-        other_ref: str,
-        other_ref_reg: Optional[str],
-        excluded_registers: List[str]
-    ) -> Optional[str]:
-
-        if self.debug:
-            sys.stdout.write("Checking for equivalent register.\n")
+        register: str,
+        current_line_no: int,
+        liveness_data: Dict[str, List[int]]
+    ) -> int:
 
-        for k, v in self.register_descriptor.items():
+        reference = self.register_descriptor[REGISTER_INDEX[register]]
 
-            if k not in excluded_registers and k != other_ref_reg:
-                # If current register is not already assigned to
-                # y or z
+        total_spill_cost = 0
 
-                for r in v:
-                    # For each reference pointed to by current register,
-                    # check if it has
+        if reference is not None:
 
-                    try:
-                        # Try/except to handle key errors for class attributes
-                        if (v in self.address_descriptor[r]['references'] and \
-                            other_ref not in self.address_descriptor[k]['references']):
+            # For the identifier referenced in the current register,
+            # calculate the number of times it appears in a later instruction
 
-                            if self.debug:
-                                sys.stdout.write("Getting register - Equivalent register found.\n")
+            if __debug__ and self.debug:
+                sys.stdout.write("Get spilled register - checking for reference " + \
+                    str(reference) + " in register " + register + "\n")
 
-                            return k4
+            current_identifier_liveness = liveness_data.get(reference, [])
 
-                    except:
-                        pass
+            # Liveness data is recorded in ascending line order, so
+            # subsequent references form the tail of the list
+            total_spill_cost = len(current_identifier_liveness) - \
+                bisect_right(current_identifier_liveness, current_line_no)
 
-                    # If inner for loop is not exited, assign register
+        if __debug__ and self.debug:
+            sys.stdout.write("Spill cost of register " + register + ": " + \
+                str(total_spill_cost) + "\n")
 
-        return None
+        return total_spill_cost
 
     def _get_spilled_register(
         self,
@@ -654,228 +721,266 @@ class Compiler:
         excluded_registers: List[str]
     ) -> str:
 
-        if self.debug:
+        if __debug__ and self.debug:
             sys.stdout.write("Checking for spilled register.\n")
             sys.stdout.write("Get spilled register - liveness data: " + \
                 str(liveness_data) + "\n")
             sys.stdout.write("Get spilled register - register descriptor: " +
                 str(self.register_descriptor) + "\n")
 
-        min_spill_cost = float("inf")
-        min_spill_cost_reg = None
+        # With only five registers a linear scan is cheaper than keeping a
+        # heap up to date. Ties go to the first register in order.
+        min_spill_cost_reg = min(
+            (k for k in REGISTERS if k not in excluded_registers),
+            key=lambda k: self._get_spill_cost(k, current_line_no, liveness_data),
+            default=None
+        )
 
-        for k, v in self.register_descriptor.items():
+        if __debug__ and self.debug:
+            sys.stdout.write("Checking for spilled register - Register obtained: " + \
+                min_spill_cost_reg + "\n")
 
-            if k not in excluded_registers:
+        return min_spill_cost_reg
 
-                total_spill_cost = 0
+    def _get_required_registers_for_assignment(
+        self,
+        ir3_node: Assignment3Node
+    ) -> Dict[str, Any]:
 
-                for r in v:
+        if ir3_node.identifier_is_class_attribute:
 
-                    # For each identifier referenced in the current register,
-                    # calculate the number of times it appears in a later instruction
+            # Requires two registers
+            # 1. x = new Object
+            # 2. Base address of object
 
-                    if self.debug:
-                        sys.stdout.write("Get spilled register - checking for reference " + \
-                            str(r) + " in register " + k + " with references " + str(v) + "\n")
+            # Need to guarantee register for base address of object is different
+            # from register for value to assign
 
-                    try:
-                        current_identifier_liveness = liveness_data[r]
+            return {
+                'y': ir3_node.identifier,
+                'z': 'placeholder'
+            }
 
-                    except:
-                        current_identifier_liveness = []
+        if ir3_node.assigned_value_is_raw_value:
 
-                    subsequent_reference_count = len(
-                        [i for i in current_identifier_liveness if i > current_line_no]
-                    )
-                    total_spill_cost += subsequent_reference_count
+            # Only requires one register for x = CONSTANT
 
-                if self.debug:
-                    sys.stdout.write("Spill cost of register " + k + ": " + \
-                        str(total_spill_cost) + "\n")
+            if __debug__ and self.debug:
+                sys.stdout.write("Getting register for plain vanilla node.\n")
 
-                if total_spill_cost < min_spill_cost:
-                    min_spill_cost = total_spill_cost
-                    min_spill_cost_reg = k
+            return {
+                'x': ir3_node.identifier
+            }
 
-        if self.debug:
-            sys.stdout.write("Checking for spilled register - Register obtained: " + \
-                min_spill_cost_reg + "\n")
+        handler = self._assigned_value_required_registers_handlers.get(
+            type(ir3_node.assigned_value),
+            self._get_required_registers_for_identifier
+        )
 
-        return min_spill_cost_reg
+        return handler(ir3_node)
 
-    def _get_required_registers(
+    def _get_required_registers_for_class_instance(
         self,
-        ir3_node: Any
-    ) -> Dict[str, str]:
-
-        if type(ir3_node) == Assignment3Node:
+        ir3_node: Assignment3Node
+    ) -> Dict[str, Any]:
 
-            is_simple_assignment = ir3_node.assigned_value_is_raw_value
+        # Only requires one register for x = new Object
 
-            if type(ir3_node.identifier) == ClassAttribute3Node:
+        return {
+            'x': ir3_node.identifier,
+        }
 
-                # Requires two registers
-                # 1. x = new Object
-                # 2. Base address of object
+    def _get_required_registers_for_binop(
+        self,
+        ir3_node: Assignment3Node
+    ) -> Dict[str, Any]:
 
-                # Need to guarantee register for base address of object is different
-                # from register for value to assign
+        if __debug__ and self.debug:
+            sys.stdout.write("Getting register for binop node.\n")
+            sys.stdout.write("Identifier: " + \
+                str(ir3_node.identifier) + "\n")
+            sys.stdout.write("Left operand: " + \
+                str(ir3_node.assigned_value.left_operand) + "\n")
+            sys.stdout.write("Right operand: " + \
+                str(ir3_node.assigned_value.right_operand) + "\n")
 
-                required_registers = {
-                    'y': ir3_node.identifier,
-                    'z': 'placeholder'
-                }
+        left_operand_is_raw_value = ir3_node.assigned_value.left_operand_is_raw_value
 
-                return required_registers
+        y_value = None
 
-            elif type(ir3_node.assigned_value) == ClassInstance3Node:
+        if not left_operand_is_raw_value or \
+            ir3_node.assigned_value.operator == '*':
+            y_value = ir3_node.assigned_value.left_operand
 
-                required_registers = {
-                    'x': ir3_node.identifier,
-                }
+        right_operand_is_raw_value = ir3_node.assigned_value.right_operand_is_raw_value
 
-                return required_registers
+        z_value = None
+        if not right_operand_is_raw_value or \
+            ir3_node.assigned_value.operator == '*':
+            z_value = ir3_node.assigned_value.right_operand
 
-            elif is_simple_assignment:
+        return {
+            'x': ir3_node.identifier,
+            'y': y_value,
+            'z': z_value
+        }
 
-                # Only requires one register for x = CONSTANT or x = new Object
+    def _get_required_registers_for_relop(
+        self,
+        ir3_node: Assignment3Node
+    ) -> Dict[str, Any]:
+
+        if __debug__ and self.debug:
+            sys.stdout.write("Getting register for relop node.\n")
+            sys.stdout.write("Identifier: " + \
+                str(ir3_node.identifier) + "\n")
+            sys.stdout.write("Left operand: " + \
+                str(ir3_node.assigned_value.left_operand) + "\n")
+            sys.stdout.write("Right operand: " + \
+                str(ir3_node.assigned_value.right_operand) + "\n")
+
+        return {
+            'x': ir3_node.identifier,
+            'y': ir3_node.assigned_value.left_operand,
+            'z': ir3_node.assigned_value.right_operand
+        }
 
-                if self.debug:
-                    sys.stdout.write("Getting register for plain vanilla node.\n")
+    def _get_required_registers_for_identifier(
+        self,
+        ir3_node: Assignment3Node
+    ) -> Dict[str, Any]:
 
-                required_registers = {
-                    'x': ir3_node.identifier
-                }
+        # x = y
 
-                return required_registers
+        if __debug__ and self.debug:
+            sys.stdout.write("Getting register for assigned value type: " + \
+                str(type(ir3_node.assigned_value)) + "\n")
+            sys.stdout.write("Assigned value: " + str(ir3_node.assigned_value) + "\n")
+            sys.stdout.write("Getting register for double identifiers.\n")
 
-            elif type(ir3_node.assigned_value) == BinOp3Node:
+        return {
+            'x': ir3_node.identifier,
+            'y': ir3_node.assigned_value,
+        }
 
-                if self.debug:
-                    sys.stdout.write("Getting register for binop node.\n")
-                    sys.stdout.write("Identifier: " + \
-                        str(ir3_node.identifier) + "\n")
-                    sys.stdout.write("Left operand: " + \
-                        str(ir3_node.assigned_value.left_operand) + "\n")
-                    sys.stdout.write("Right operand: " + \
-                        str(ir3_node.assigned_value.right_operand) + "\n")
+    def _get_required_registers_for_return(
+        self,
+        ir3_node: Return3Node
+    ) -> Dict[str, Any]:
 
-                left_operand_is_raw_value = ir3_node.assigned_value.left_operand_is_raw_value
+        return {
+            'x': ir3_node.return_value
+        }
 
-                y_value = None
+    def _get_required_registers_for_class_attribute(
+        self,
+        ir3_node: ClassAttribute3Node
+    ) -> Dict[str, Any]:
 
-                if not left_operand_is_raw_value or \
-                    ir3_node.assigned_value.operator == '*':
-                    y_value = ir3_node.assigned_value.left_operand
+        return {
+            'x': ir3_node.object_name
+        }
 
-                right_operand_is_raw_value = ir3_node.assigned_value.right_operand_is_raw_value
+    def _get_required_registers_for_readln(
+        self,
+        ir3_node: ReadLn3Node
+    ) -> Dict[str, Any]:
 
-                z_value = None
-                if not right_operand_is_raw_value or \
-                    ir3_node.assigned_value.operator == '*':
-                    z_value = ir3_node.assigned_value.right_operand
+        return {
+            'x': ir3_node.id3
+        }
 
-                required_registers = {
-                    'x': ir3_node.identifier,
-                    'y': y_value,
-                    'z': z_value
-                }
+    def _get_required_registers_for_if_goto(
+        self,
+        ir3_node: IfGoTo3Node
+    ) -> Dict[str, Any]:
 
-                return required_registers
+        rel_exp = ir3_node.rel_exp
 
-            elif type(ir3_node.assigned_value) == RelOp3Node:
+        # Identifiers and attributes are compared against true directly,
+        # so only relational expressions need a second register
 
-                if self.debug:
-                    sys.stdout.write("Getting register for relop node.\n")
-                    sys.stdout.write("Identifier: " + \
-                        str(ir3_node.identifier) + "\n")
-                    sys.stdout.write("Left operand: " + \
-                        str(ir3_node.assigned_value.left_operand) + "\n")
-                    sys.stdout.write("Right operand: " + \
-                        str(ir3_node.assigned_value.right_operand) + "\n")
+        if type(rel_exp) is str:
 
-                y_value = ir3_node.assigned_value.left_operand
-                z_value = ir3_node.assigned_value.right_operand
+            # Identifier (no raw values for IR3)
+            return {
+                'y': rel_exp,
+            }
 
-                required_registers = {
-                    'x': ir3_node.identifier,
-                    'y': y_value,
-                    'z': z_value
-                }
+        elif type(rel_exp) is RelOp3Node:
 
-                return required_registers
+            # Raw operands are moved into y or compared as an immediate,
+            # so only an identifier or a raw value that cannot be encoded
+            # as an immediate on the right needs a z register
+            required_registers = {
+                'y': 'placeholder' if rel_exp.left_operand_is_raw_value \
+                    else rel_exp.left_operand
+            }
 
-            else:
+            if not rel_exp.right_operand_is_raw_value:
+                required_registers['z'] = rel_exp.right_operand
 
-                if self.debug:
-                    sys.stdout.write("Getting register for assigned value type: " + \
-                        str(type(ir3_node.assigned_value)) + "\n")
-                    sys.stdout.write("Assigned value: " + str(ir3_node.assigned_value) + "\n")
+            elif not self._is_encodable_immediate(
+                abs(self._get_raw_operand_immediate(rel_exp.right_operand))
+            ):
+                required_registers['z'] = 'placeholder'
 
-                # x = y
+            return required_registers
 
-                if self.debug:
-                    sys.stdout.write("Getting register for double identifiers.\n")
+        elif type(rel_exp) is IR3Node:
 
-                required_registers = {
-                    'x': ir3_node.identifier,
-                    'y': ir3_node.assigned_value,
-                }
+            return {
+                'y': rel_exp.value,
+            }
 
-        elif type(ir3_node) == Return3Node:
+        return self._get_required_registers_for_uncaught(ir3_node)
 
-            required_registers = {
-                'x': ir3_node.return_value
-            }
+    def _get_required_registers_for_uncaught(
+        self,
+        ir3_node: Any
+    ) -> Dict[str, Any]:
 
-        elif type(ir3_node) == ClassAttribute3Node:
+        if __debug__ and self.debug:
+            sys.stdout.write("Getting required registers - uncaught situation: " + \
+                str(type(ir3_node)) + "\n")
 
-            required_registers = {
-                'x': ir3_node.object_name
-            }
+        return {}
 
-        elif type(ir3_node) == ReadLn3Node:
+    def _get_required_registers(
+        self,
+        ir3_node: Any
+    ) -> Dict[str, Any]:
 
-            required_registers = {
-                'x': ir3_node.id3
-            }
+        # Precomputed per statement by _get_md_required_registers
+        return self.md_required_registers[ir3_node.md_line_no - 1]
 
-        elif type(ir3_node) == IfGoTo3Node:
+    def _get_md_required_registers(self) -> List[Dict[str, Any]]:
 
-            if type(ir3_node.rel_exp) == str:
+        # Required registers depend only on the statement, so dispatch on
+        # each statement type once per method. Statements that never
+        # request registers map to an empty dictionary.
 
-                # Identifier (no raw values for IR3)
-                required_registers = {
-                    'y': ir3_node.rel_exp,
-                    'z': 'placeholder'
-                }
+        md_required_registers = []
 
-            elif type(ir3_node.rel_exp) == RelOp3Node:
+        # Bind the handler table and append once, as this runs per statement
+        get_handler = self._required_registers_handlers.get
+        append_required_registers = md_required_registers.append
 
-                required_registers = {
-                    'y': ir3_node.rel_exp.left_operand,
-                    'z': ir3_node.rel_exp.right_operand
-                }
+        for current_stmt in self.md_statements:
 
-            elif type(ir3_node.rel_exp) == IR3Node:
+            handler = get_handler(type(current_stmt))
 
-                required_registers = {
-                    'y': ir3_node.rel_exp.value,
-                    'z': 'placeholder'
-                }
+            if handler:
+                append_required_registers(handler(current_stmt))
 
-        else:
-            if self.debug:
-                sys.stdout.write("Getting required registers - uncaught situation: " + \
-                    str(ir3_node.rel_exp) + "\n")
+            else:
+                append_required_registers({})
 
-        return required_registers
+        return md_required_registers
 
     def _get_registers(
         self,
         ir3_node: Any,
-        md_args: List[str],
         liveness_data: Dict[str, List[int]]
     ) -> Any:
 
@@ -894,29 +999,18 @@ class Compiler:
 
             register_found = False
 
-            if self.debug:
+            if __debug__ and self.debug:
                 sys.stdout.write("Getting register for binop node - " + k + \
                     "\n")
 
             if not v:
                 continue
 
-            '''
-            is_arg = self._check_if_in_arguments(
-                v,
-                md_args
-            )
-
-            if is_arg:
-                register_data[k] = (is_arg, False)
-                continue
-            '''
-
             is_in_register = self._check_if_in_register(v, excluded_registers)
 
             if is_in_register:
 
-                if self.debug:
+                if __debug__ and self.debug:
                     sys.stdout.write("Register found in address descriptor: " + \
                         str(is_in_register) + "\n")
 
@@ -924,13 +1018,13 @@ class Compiler:
                 excluded_registers.append(is_in_register[0])
                 continue
 
-            if self.debug:
+            if __debug__ and self.debug:
                 sys.stdout.write("Register not found in address descriptor.\n")
 
             # If x is not in a register, and there is a register currently empty,
             # pick that register
 
-            if self.debug:
+            if __debug__ and self.debug:
                 sys.stdout.write("Getting register - current register descriptor: " +
                     str(self.register_descriptor) + "\n")
 
@@ -955,59 +1049,16 @@ class Compiler:
                 excluded_registers.append(empty_register)
                 continue
 
-            if self.debug:
+            if __debug__ and self.debug:
                 sys.stdout.write("Getting register - Check #1 Alternative locations failed.\n")
 
-            # 2. if value in register = y [x = y + z], and y is not z, it can be replaced
-
-            if self.debug:
-                sys.stdout.write("Getting register - Check #2 [x = y + z], and y is not z, it can be replaced.\n")
-
-            if k == 'y' or k == 'z':
-
-                other_ref = None
-                other_ref_reg = None
-
-                if k == 'y':
-
-                    try:
-                        other_ref = required_registers['z']
-                        other_ref_reg = register_data['z'][0]
-                    except:
-                        pass
-
-                elif k == 'z':
+            # 2. if value is not used later, it can be replaced
 
-
-                    try:
-                        other_ref = required_registers['y']
-                        other_ref_reg = register_data['y'][0]
-                    except:
-                        pass
-
-                empty_register = self._check_for_equivalent_register(
-                    v,
-                    other_ref,
-                    other_ref_reg,
-                    excluded_registers
-                )
-                if empty_register:
-                    register_data[k] = (empty_register, False)
-                    excluded_registers.append(empty_register)
-                    continue
-
-            if self.debug:
-                    sys.stdout.write("Getting register - Check #2 failed.\n")
-
-            # 3. if value is not used later, it can be replaced
-
-            if self.debug:
-                sys.stdout.write("Getting register - Check #3 Replace no subsequent use.\n")
+            if __debug__ and self.debug:
+                sys.stdout.write("Getting register - Check #2 Replace no subsequent use.\n")
 
             replaced_register = self._check_for_no_subsequent_use(
-                k,
                 ir3_node.md_line_no,
-                liveness_data,
                 excluded_registers
             )
             if replaced_register:
@@ -1015,10 +1066,10 @@ class Compiler:
                 excluded_registers.append(replaced_register)
                 continue
 
-            # 4. Calculate spilling cost and replace register with lowest cost
+            # 3. Calculate spilling cost and replace register with lowest cost
 
-            if self.debug:
-                sys.stdout.write("Getting register - Check #4 Getting spilled register.\n")
+            if __debug__ and self.debug:
+                sys.stdout.write("Getting register - Check #3 Getting spilled register.\n")
 
             spilled_register = self._get_spilled_register(
                 v,
@@ -1039,7 +1090,7 @@ class Compiler:
         label: str
     ) -> None:
 
-        if self.debug:
+        if __debug__ and self.debug:
             sys.stdout.write("\nDescriptors before label update.\n")
             sys.stdout.write("Address descriptor: " + str(self.address_descriptor) + \
                 "\n")
@@ -1047,7 +1098,24 @@ class Compiler:
         # Update sole reference to label
 
         # There should be one reference only for a string identifier
-        self.address_descriptor[identifier]['references'] = deque([label])
+        self.address_descriptor[identifier]['references'] = {label}
+
+    def _get_primary_reference(self, identifier: Any) -> Optional[str]:
+
+        # A data label takes precedence over registers holding the same
+        # value. Registers are returned in REGISTERS order.
+
+        references = self.address_descriptor[identifier]['references']
+
+        for r in references:
+            if r[0] == 'd':
+                return r
+
+        for r in REGISTERS:
+            if r in references:
+                return r
+
+        return None
 
     def _update_descriptors(
         self,
@@ -1055,60 +1123,127 @@ class Compiler:
         identifier: Any
     ) -> None:
 
-        if self.debug:
+        self._update_multiple_descriptors(((register, identifier),))
+
+    def _update_multiple_descriptors(
+        self,
+        updates: Sequence[Tuple[str, Any]]
+    ) -> None:
+
+        # Apply the register and identifier pairs loaded by one statement in
+        # order, as if _update_descriptors was called for each of them
+
+        if __debug__ and self.debug:
             sys.stdout.write("\nDescriptors before update.\n")
             sys.stdout.write("Register descriptor: " + str(self.register_descriptor) + \
                 "\n")
             sys.stdout.write("Address descriptor: " + str(self.address_descriptor) + \
                 "\n")
 
+        for register, identifier in updates:
+            self._apply_descriptor_update(register, identifier)
+
+        if __debug__ and self.debug:
+            sys.stdout.write("\nDescriptors updated.\n")
+            sys.stdout.write("Register descriptor: " + str(self.register_descriptor) + \
+                "\n")
+            sys.stdout.write("Address descriptor: " + str(self.address_descriptor) + \
+                "\n")
+
+    def _apply_descriptor_update(
+        self,
+        register: str,
+        identifier: Any
+    ) -> None:
+
         # Save current references in register
 
-        try:
-            current_register_reference = self.register_descriptor[register]
-        except:
+        register_index = REGISTER_INDEX.get(register)
+
+        if register_index is not None:
+            current_register_reference = self.register_descriptor[register_index]
+        else:
             current_register_reference = None
 
         # Remove register references in address descriptor
 
-        if current_register_reference:
-            for r in current_register_reference:
-                try:
-                    self.address_descriptor[r]['references'].remove(register)
-                except:
-                    pass
+        if current_register_reference is not None:
+            r_address_data = self.address_descriptor.get(current_register_reference)
+
+            if r_address_data:
+                r_address_data['references'].discard(register)
 
         # Check if identifier is a ClassAttribute3Node
 
-        if type(identifier) == ClassAttribute3Node:
+        if type(identifier) is ClassAttribute3Node:
 
-            # Set register to empty list since it is a temporary store
+            # Clear the register since it is a temporary store
             # before storing to memory
 
-            self.register_descriptor[register] = deque([])
+            if register_index is not None:
+                self.register_descriptor[register_index] = None
 
         else:
             # Set register to identifier in register descriptor
 
-            self.register_descriptor[register] = deque([identifier])
+            if register_index is not None:
+                self.register_descriptor[register_index] = identifier
 
             # Set identifier to register in address descriptor
 
-            try:
-                self.address_descriptor[identifier]['references'].append(register)
-            except:
-                pass
+            identifier_address_data = self.address_descriptor.get(identifier)
 
-        if self.debug:
-            sys.stdout.write("\nDescriptors updated.\n")
-            sys.stdout.write("Register descriptor: " + str(self.register_descriptor) + \
-                "\n")
-            sys.stdout.write("Address descriptor: " + str(self.address_descriptor) + \
-                "\n")
+            if identifier_address_data:
+                identifier_address_data['references'].add(register)
+
+    def _discard_register_references(
+        self,
+        identifier: Any
+    ) -> None:
+
+        # Forget the registers holding a previous value of the identifier
+
+        identifier_address_data = self.address_descriptor.get(identifier)
+
+        if not identifier_address_data:
+            return
+
+        references = identifier_address_data['references']
+
+        for register in REGISTERS:
+
+            if register in references:
+                references.discard(register)
+
+                register_index = REGISTER_INDEX[register]
+
+                if self.register_descriptor[register_index] == identifier:
+                    self.register_descriptor[register_index] = None
+
+    def _forget_register_contents(self) -> None:
+
+        # Control can reach a label from more than one place, so what the
+        # registers hold is unknown there. Data label references are kept.
+
+        register_descriptor = self.register_descriptor
+
+        for register_index, identifier in enumerate(register_descriptor):
+
+            if identifier is None:
+                continue
+
+            identifier_address_data = self.address_descriptor.get(identifier)
+
+            if identifier_address_data:
+                identifier_address_data['references'].discard(
+                    REGISTERS[register_index]
+                )
+
+            register_descriptor[register_index] = None
 
     def _reset_descriptors(self) -> None:
 
-        if self.debug:
+        if __debug__ and self.debug:
             sys.stdout.write("Resetting descriptors.\n")
             sys.stdout.write("Register descriptor: " + str(self.register_descriptor) + \
                 "\n")
@@ -1117,100 +1252,66 @@ class Compiler:
 
 
         self.address_descriptor = {}
-        self.register_descriptor = {
-            'v1': deque(),
-            'v2': deque(),
-            'v3': deque(),
-            'v4': deque(),
-            'v5': deque(),
-        }
+        self.register_descriptor = [None] * len(REGISTERS)
+        self.md_var_offsets = {}
 
-    def _initialise_assembler_directive(self) -> "Instruction":
-
-        instruction_data = Instruction(
-            instruction=".data\n\n",
-        )
+    def _initialise_assembler_directive(self) -> None:
 
         instruction_L1 = Instruction(
             instruction="L1:\n.text\n.global main\n\n"
         )
 
-        self._link_instructions([
-            instruction_data,
-            instruction_L1
-        ])
+        # Data directives are collected separately as plain strings so that
+        # string and format data can be added while the text section is
+        # generated. They are never optimised, so need no Instruction.
 
-        return instruction_data
+        self.data_lines = [".data\n\n"]
+        self.instructions = [instruction_L1]
 
     def _convert_ir3_to_assembly(self, ir3_tree: "IR3Tree") -> None:
 
         self.instruction_count = self.data_label_count = 0
-        self.instruction_head = self.instruction_data_tail = \
-            self.instruction_tail = None
 
         self._reset_descriptors()
 
-        self.instruction_head = self.instruction_data_tail = \
+        self._build_class_layouts(ir3_tree.head.class_data)
+
         self._initialise_assembler_directive()
-        self.instruction_tail = self.instruction_head.get_last_child()
 
-        main_instruction = self._convert_cmtd3_to_assembly(
+        main_instructions = self._convert_cmtd3_to_assembly(
             ir3_tree.head.method_data,
             ir3_tree.head.class_data
         )
 
+        # Methods are converted one after another. Each starts from reset
+        # descriptors, but data and branch labels are numbered from counters
+        # shared across methods and data directives are appended to one
+        # section, so the output depends on this order.
+
         current_node = ir3_tree.head.method_data.child
-        completed = False
 
-        while not completed:
+        while current_node:
             # Iterate through methods
 
-            if not current_node:
-                # If no other methods, terminate loop
-                completed=True
+            self._reset_descriptors()
 
-            if current_node:
+            self.instructions.extend(self._convert_cmtd3_to_assembly(
+                current_node,
+                ir3_tree.head.class_data
+            ))
 
-                self._reset_descriptors()
-
-                instruction = self._convert_cmtd3_to_assembly(
-                    current_node,
-                    ir3_tree.head.class_data
-                )
-
-                current_tail = self.instruction_tail
-
-                self._link_instructions([
-                    current_tail,
-                    instruction
-                ])
-
-                self.instruction_tail = instruction.get_last_child()
-
-                current_node = current_node.child
-
-        current_tail = self.instruction_tail
-
-        self._link_instructions([
-            current_tail,
-            main_instruction
-        ])
+            current_node = current_node.child
 
-        self.instruction_tail = main_instruction.get_last_child()
+        # Main method is emitted last
+        self.instructions.extend(main_instructions)
 
     def _generate_control_flow(self, ir3_tree: Any) -> None:
 
         current_node = ir3_tree.head.method_data
-        completed = False
 
-        while not completed:
+        while current_node:
             # Iterate through methods
 
-            if not current_node:
-                # If no other methods, terminate loop
-                completed=True
-                break
-
             self.control_flow_generator.generate_basic_blocks(
                 current_node
             )
@@ -1221,31 +1322,38 @@ class Compiler:
         self,
         ir3_node: "CMtd3Node",
         ir3_class_data: "CData3Node"
-    ) -> "Instruction":
+    ) -> List["Instruction"]:
+
+        # The method is emitted into a flat list in order, so statements
+        # are appended as they are converted rather than linked together
 
         self._reset_descriptors()
 
         # Get method arguments to cascade down to each statement
         md_args = ir3_node.get_arguments()
+        self.md_arg_registers = self._get_md_arg_registers(md_args)
 
         # Set up callee-saved registers
 
-        method_name = ir3_node.method_id
-        if method_name[0] == "%":
-            method_name = method_name[1:]
+        method_name = self._get_method_label(ir3_node.method_id)
 
         instruction_start_label = LabelInstruction(
             label=method_name
         )
 
         instruction_push_callee_saved = Instruction(
-            instruction="stmfd sp!,{v1,v2,v3,v4,v5,fp,lr}\n"
+            instruction=PUSH_CALLEE_SAVED_REGISTERS
         )
 
         instruction_set_frame_pointer = Instruction(
             instruction="add fp,sp,#24\n",
         )
 
+        # Materialise statements for variable declarations, liveness
+        # and register allocation
+        self.md_statements = self._get_md_statements(ir3_node)
+        self.md_required_registers = self._get_md_required_registers()
+
         # Set aside space for variable declarations
 
         var_decl_offset = self._calculate_offset_for_md_vardecl(
@@ -1254,39 +1362,45 @@ class Compiler:
         )
 
         instruction_set_space_for_var_decl = Instruction(
-            instruction="sub sp,fp,#" + str(var_decl_offset) + "\n"
+            instruction=f"sub sp,fp,#{var_decl_offset}\n"
         )
 
         # Convert statements to assembly code
 
-        if self.debug:
+        if __debug__ and self.debug:
             sys.stdout.write("Converting stmt to assembly - Arguments - " + \
                 str(md_args) + "\n")
 
         # Compute liveness information
-        liveness_data = self._get_md_liveness_data(
-            ir3_node,
-            md_args
-        )
+        liveness_data = self._get_md_liveness_data(ir3_node)
 
-        if self.debug:
+        self.md_live_intervals = self._get_md_live_intervals(liveness_data)
+
+        if __debug__ and self.debug:
             sys.stdout.write("Converting stmt to assembly - Liveness data - " + \
                 str(liveness_data) + "\n")
 
         # Pre-generate exit label for method
         # Needed for early termination e.g. multiple return statements
 
-        exit_label = "." + method_name + "Exit"
+        exit_label = f".{method_name}Exit"
+
+        method_instructions = [
+            instruction_start_label,
+            instruction_push_callee_saved,
+            instruction_set_frame_pointer,
+            instruction_set_space_for_var_decl,
+        ]
 
         # Convert statements to assembly
 
-        stmt_start_instruction = self._convert_stmt_to_assembly(
+        self._convert_stmt_to_assembly(
             ir3_node.statements,
             md_args,
             liveness_data,
-            exit_label
+            exit_label,
+            method_instructions
         )
-        stmt_end_instruction = stmt_start_instruction.get_last_child()
 
         # Placeholder label to exit method
 
@@ -1301,250 +1415,262 @@ class Compiler:
         )
 
         instruction_pop_callee_saved = Instruction(
-            instruction="ldmfd sp!,{v1,v2,v3,v4,v5,fp,pc}\n",
+            instruction=POP_CALLEE_SAVED_REGISTERS,
         )
 
-        self._link_instructions([
-            instruction_start_label,
-            instruction_push_callee_saved,
-            instruction_set_frame_pointer,
-            instruction_set_space_for_var_decl,
-            stmt_start_instruction
-        ])
+        method_instructions.append(instruction_exit_label)
+        method_instructions.append(instruction_reset_frame_pointer)
+        method_instructions.append(instruction_pop_callee_saved)
 
-        self._link_instructions([
-            stmt_end_instruction,
-            instruction_exit_label,
-            instruction_reset_frame_pointer,
-            instruction_pop_callee_saved
-        ])
+        return method_instructions
 
-        return instruction_start_label
+    def _get_md_var_decls(self, ir3_node: "CMtd3Node") -> Iterator[VarDecl3Node]:
 
-    def _calculate_offset_for_md_vardecl(
-        self,
-        ir3_node: "CMtd3Node",
-        ir3_class_data: "CData3Node"
-    ) -> int:
+        # Variable declarations of the method, followed by those declared
+        # among its statements. Requires self.md_statements to be set.
 
-        fp_offset = 24
+        current_var_decl: Optional[VarDecl3Node] = ir3_node.variable_declarations
 
-        current_var_decl = ir3_node.variable_declarations
-        var_decl_completed = False
+        while current_var_decl:
 
-        while not var_decl_completed:
+            if type(current_var_decl) is VarDecl3Node:
+                yield current_var_decl
 
-            if not current_var_decl:
-                var_decl_completed = True
-                break
+            current_var_decl = current_var_decl.child
 
-            if type(current_var_decl) == VarDecl3Node:
+        for current_stmt in self.md_statements:
 
-                # Calculate offset
-                fp_offset += 4
+            if type(current_stmt) is VarDecl3Node:
+                yield current_stmt
 
-                # Add variable and offset to symbol table
-                if self.debug:
-                    sys.stdout.write("Calculating space for var decl: " + \
-                        str(current_var_decl.value) + "\n")
-                    sys.stdout.write("Offset: " + str(fp_offset) + "\n")
+    def _calculate_offset_for_md_vardecl(
+        self,
+        ir3_node: "CMtd3Node",
+        ir3_class_data: "CData3Node"
+    ) -> int:
 
-                self._declare_new_variable(
-                    current_var_decl.value,
-                    fp_offset
-                )
+        fp_offset: int = 24
 
-                if self.debug:
-                    sys.stdout.write("Add var decl to address descriptor: " + \
-                        str(self.address_descriptor) + "\n")
+        current_var_decl: VarDecl3Node
 
-            current_var_decl = current_var_decl.child
+        for current_var_decl in self._get_md_var_decls(ir3_node):
 
-        current_stmt = ir3_node.statements
-        stmt_completed = False
+            # Calculate offset
+            fp_offset += 4
 
-        while not stmt_completed:
+            # Add variable and offset to symbol table
+            if __debug__ and self.debug:
+                sys.stdout.write("Calculating space for var decl: " + \
+                    str(current_var_decl.value) + "\n")
+                sys.stdout.write("Offset: " + str(fp_offset) + "\n")
 
-            if not current_stmt:
-                stmt_completed = True
-                break
+            self._declare_new_variable(
+                current_var_decl.value,
+                fp_offset
+            )
 
-            if type(current_stmt) == VarDecl3Node:
+            if __debug__ and self.debug:
+                sys.stdout.write("Add var decl to address descriptor: " + \
+                    str(self.address_descriptor) + "\n")
 
-                # Calculate offset
-                fp_offset += 4
+        return fp_offset
 
-                # Add variable and offset to symbol table
-                if self.debug:
-                    sys.stdout.write("Calculating space for var decl: " + \
-                        str(current_stmt.value) + "\n")
-                    sys.stdout.write("Offset: " + str(fp_offset) + "\n")
+    def _convert_readln_stmt(
+        self,
+        ir3_node: ReadLn3Node,
+        md_args: List[str],
+        liveness_data: Dict[str, List[int]],
+        exit_label: str
+    ) -> "Instruction":
 
-                self._declare_new_variable(current_stmt.value, fp_offset)
+        return self._convert_readln_to_assembly(
+            ir3_node,
+            md_args,
+            liveness_data
+        )
 
-                if self.debug:
-                    sys.stdout.write("Add var decl to address descriptor: " + \
-                        str(self.address_descriptor) + "\n")
+    def _convert_println_stmt(
+        self,
+        ir3_node: PrintLn3Node,
+        md_args: List[str],
+        liveness_data: Dict[str, List[int]],
+        exit_label: str
+    ) -> "Instruction":
 
-            current_stmt = current_stmt.child
+        return self._convert_println_to_assembly(
+            ir3_node,
+            md_args
+        )
 
-        return fp_offset
+    def _convert_assignment_stmt(
+        self,
+        ir3_node: Assignment3Node,
+        md_args: List[str],
+        liveness_data: Dict[str, List[int]],
+        exit_label: str
+    ) -> "Instruction":
 
-    def _convert_stmt_to_assembly(
+        return self._convert_assignment_to_assembly(
+            ir3_node,
+            md_args,
+            liveness_data
+        )
+
+    def _convert_return_stmt(
         self,
-        ir3_node: Any,
+        ir3_node: Return3Node,
         md_args: List[str],
         liveness_data: Dict[str, List[int]],
         exit_label: str
     ) -> "Instruction":
 
-        if self.debug:
-            sys.stdout.write("Converting stmt to assembly - Args: " + \
-                str(md_args) + "\n")
+        return self._convert_return_to_assembly(
+            ir3_node,
+            md_args,
+            liveness_data,
+            exit_label
+        )
 
-        first_instruction = None
-        current_instruction = None
-        new_instruction = None
+    def _convert_label_stmt(
+        self,
+        ir3_node: Label3Node,
+        md_args: List[str],
+        liveness_data: Dict[str, List[int]],
+        exit_label: str
+    ) -> "Instruction":
 
-        current_stmt = ir3_node
-        completed = False
+        self._forget_register_contents()
 
-        while not completed:
+        return LabelInstruction(
+            label=f".{ir3_node.label_id}"
+        )
 
-            if self.debug:
-                sys.stdout.write("Converting stmt to assembly - current stmt: " + \
-                    str(type(current_stmt)) + "\n")
+    def _convert_if_goto_stmt(
+        self,
+        ir3_node: IfGoTo3Node,
+        md_args: List[str],
+        liveness_data: Dict[str, List[int]],
+        exit_label: str
+    ) -> "Instruction":
 
-            if not current_stmt:
-                completed = True
-                break
+        return self._convert_if_goto_statement_to_assembly(
+            ir3_node,
+            md_args,
+            liveness_data
+        )
 
-            if type(current_stmt) == ReadLn3Node:
+    def _convert_goto_stmt(
+        self,
+        ir3_node: GoTo3Node,
+        md_args: List[str],
+        liveness_data: Dict[str, List[int]],
+        exit_label: str
+    ) -> "Instruction":
 
-                new_instruction = self._convert_readln_to_assembly(
-                    current_stmt,
-                    current_instruction,
-                    md_args,
-                    liveness_data
-                )
+        return UnconditionalBranchInstruction(
+            label=f".{ir3_node.goto}"
+        )
 
-            elif type(current_stmt) == PrintLn3Node:
+    def _convert_uncaught_stmt(
+        self,
+        ir3_node: Any,
+        md_args: List[str],
+        liveness_data: Dict[str, List[int]],
+        exit_label: str
+    ) -> "Instruction":
 
-                new_instruction = self._convert_println_to_assembly(
-                    current_stmt,
-                    md_args,
-                    current_instruction
-                )
+        return Instruction(
+            instruction="Uncaught statement detected\n"
+        )
 
-            elif type(current_stmt) == Assignment3Node:
+    def _convert_stmt_to_assembly(
+        self,
+        ir3_node: Any,
+        md_args: List[str],
+        liveness_data: Dict[str, List[int]],
+        exit_label: str,
+        instructions: List["Instruction"]
+    ) -> None:
 
-                new_instruction = self._convert_assignment_to_assembly(
-                    current_stmt,
-                    md_args,
-                    liveness_data
-                )
+        # Appends the instructions of each statement to the given list as
+        # it is converted. Statements are not linked to one another, so
+        # only the instructions of the newest statement are walked.
 
-            elif type(current_stmt) == VarDecl3Node:
-                # Ignore VarDecl3 node since no instructions are required
-                if self.debug:
-                    sys.stdout.write("Converting stmt to assembly - "
-                        "Skipping VarDecl3Node.\n")
+        if __debug__ and self.debug:
+            sys.stdout.write("Converting stmt to assembly - Args: " + \
+                str(md_args) + "\n")
 
-            elif type(current_stmt) == Return3Node:
+        new_instruction: Optional["Instruction"] = None
 
-                new_instruction = self._convert_return_to_assembly(
-                    current_stmt,
-                    md_args,
-                    liveness_data,
-                    exit_label
-                )
+        current_stmt: Any = ir3_node
 
-            elif type(current_stmt) == Label3Node:
+        # Bind the handler lookup once rather than per statement
+        get_handler = self._stmt_handlers.get
+        convert_uncaught_stmt = self._convert_uncaught_stmt
 
-                new_instruction = LabelInstruction(
-                    label="." + str(current_stmt.label_id)
-                )
+        while current_stmt:
 
-            elif type(current_stmt) == IfGoTo3Node:
+            if __debug__ and self.debug:
+                sys.stdout.write("Converting stmt to assembly - current stmt: " + \
+                    str(type(current_stmt)) + "\n")
 
-                new_instruction = self._convert_if_goto_statement_to_assembly(
-                    current_stmt,
-                    md_args,
-                    liveness_data
-                )
+            current_stmt_type = type(current_stmt)
 
-            elif type(current_stmt) == GoTo3Node:
+            # Variable declarations need no instructions as their stack
+            # offsets are allocated before the statements are converted
+            if current_stmt_type is VarDecl3Node:
 
-                new_instruction = UnconditionalBranchInstruction(
-                    label="." + str(current_stmt.goto)
-                )
+                if __debug__ and self.debug:
+                    sys.stdout.write("Converting stmt to assembly - "
+                        "Skipping VarDecl3Node.\n")
 
-            else:
+                current_stmt = current_stmt.child
+                continue
 
-                new_instruction = Instruction(
-                    instruction="Uncaught statement detected\n",
-                    parent=current_instruction
-                )
+            handler = get_handler(
+                current_stmt_type,
+                convert_uncaught_stmt
+            )
+
+            new_instruction = handler(
+                current_stmt,
+                md_args,
+                liveness_data,
+                exit_label
+            )
 
             if new_instruction:
 
-                if self.debug:
+                if __debug__ and self.debug:
                     sys.stdout.write("Converting stmt to assembly - Generated instruction: " + \
                         new_instruction.__str__() + "\n")
 
-                if current_instruction:
-                    if self.debug:
-                        sys.stdout.write("Converting stmt to assembly - Adding instruction\n")
-                    current_instruction.set_child(new_instruction)
-
-                else:
-                    if self.debug:
-                        sys.stdout.write("Converting stmt to assembly - First instruction\n")
-                    first_instruction = new_instruction
-
-                current_instruction = new_instruction.get_last_child()
+                self._append_instructions(new_instruction, instructions)
 
             new_instruction = None
             current_stmt = current_stmt.child
 
-        return first_instruction
-
     def _convert_readln_to_assembly(
         self,
         readln3node: ReadLn3Node,
-        current_instruction: Optional["Instruction"],
         md_args: List[str],
         liveness_data: Dict[str, List[int]]
     ) -> "Instruction":
 
-        read_data_string_label = "d" + str(self.data_label_count) + \
-            "_" + str(readln3node.id3) + "_format"
-
-        read_data_label = "d" + str(self.data_label_count) + \
-            "_" + str(readln3node.id3)
+        read_data_label = f"d{self.data_label_count}_{readln3node.id3}"
+        read_data_string_label = f"{read_data_label}_format"
         self.data_label_count += 1
 
-        if self.debug:
+        if __debug__ and self.debug:
             sys.stdout.write("Converting readln to assembly - Expression.\n")
 
         # Initialise storage variable for integer in data
 
-        instruction_initialise_readln_data_storage_format = Instruction(
-            instruction=read_data_string_label + ": .asciz \"%d\"\n"
-        )
-
-        instruction_initialise_readln_data_storage_identifier = Instruction(
-            instruction=read_data_label + ": .word 0\n"
-        )
-
-        self._link_instructions([
-            instruction_initialise_readln_data_storage_format,
-            instruction_initialise_readln_data_storage_identifier,
+        self.data_lines.extend([
+            f"{read_data_string_label}: .asciz \"%d\"\n",
+            f"{read_data_label}: .word 0\n"
         ])
 
-        self.instruction_data_tail.insert_child(instruction_initialise_readln_data_storage_format)
-        self.instruction_data_tail = instruction_initialise_readln_data_storage_identifier
-
         # Actual instructions to read input
 
         instruction_load_readln_format = LoadInstruction(
@@ -1565,7 +1691,6 @@ class Compiler:
 
         store_register = self._get_registers(
             readln3node,
-            md_args,
             liveness_data
         )['x'][0]
 
@@ -1599,14 +1724,14 @@ class Compiler:
         # in case there are nested function calls
 
         instruction_save_arg_registers = Instruction(
-            instruction="stmfd sp!,{a1,a2,a3,a4}\n"
+            instruction=SAVE_ARG_REGISTERS
         )
 
         # Restore argument registers from stack to restore argument values
         # after nested function call
 
         instruction_pop_arg_registers = Instruction(
-            instruction="ldmfd sp!,{a1,a2,a3,a4}\n"
+            instruction=RESTORE_ARG_REGISTERS
         )
 
         self._link_instructions([
@@ -1626,18 +1751,20 @@ class Compiler:
         self,
         println3node: PrintLn3Node,
         md_args: List[str],
-        current_instruction: Optional["Instruction"],
     ) -> "Instruction":
 
-        print_data_label = "d" + str(self.data_label_count)
+        print_data_label = f"d{self.data_label_count}"
+
+        # Basic types are enum members, so identity comparison suffices
+        println_type = println3node.type
 
-        if self.debug:
+        if __debug__ and self.debug:
             sys.stdout.write("Converting println to assembly - Expression: " + \
                 str(println3node.expression) + "\n")
 
-        if println3node.type == BasicType.INT:
+        if println_type is BasicType.INT:
 
-            if self.debug:
+            if __debug__ and self.debug:
                 sys.stdout.write("Converting println to assembly - Integer detected.\n")
 
             if println3node.is_raw_value:
@@ -1677,12 +1804,12 @@ class Compiler:
                         offset=-identifier_offset
                     )
 
-            instruction_initialise_print_data_assembly_code = print_data_label + \
-                ": .asciz \"%i\"\n"
+            instruction_initialise_print_data_assembly_code = \
+                f"{print_data_label}: .asciz \"%i\"\n"
 
-        elif println3node.type == BasicType.STRING:
+        elif println_type is BasicType.STRING:
 
-            if self.debug:
+            if __debug__ and self.debug:
                 sys.stdout.write("Converting println to assembly - String detected.\n")
 
             # Check if it is a raw string
@@ -1694,16 +1821,20 @@ class Compiler:
                     immediate=0
                 )
 
-                instruction_initialise_print_data_assembly_code = print_data_label + \
-                    ": .asciz " + println3node.expression[:-1] + '"' + "\n"
+                # String literals keep both quotes from the lexer, so they
+                # are emitted as they are
+                instruction_initialise_print_data_assembly_code = \
+                    f"{print_data_label}: .asciz {println3node.expression}\n"
 
             # Otherwise, lookup symbol table
             else:
 
-                if self.debug:
+                if __debug__ and self.debug:
                     sys.stdout.write("Converting println to assembly - Identifier detected.\n")
 
-                print_data_label = self.address_descriptor[println3node.expression]['references'][0]
+                print_data_label = self._get_primary_reference(
+                    println3node.expression
+                )
 
                 # Print data label should be the only reference for address descriptor
                 # of a string unless it is returned from a method call.
@@ -1726,9 +1857,9 @@ class Compiler:
                         rn=print_data_label
                     )
 
-        elif println3node.type == BasicType.BOOL:
+        elif println_type is BasicType.BOOL:
 
-            if self.debug:
+            if __debug__ and self.debug:
                 sys.stdout.write("Converting println to assembly - Boolean detected.\n")
 
             # Check if it is a raw boolean
@@ -1740,32 +1871,46 @@ class Compiler:
                     immediate=0
                 )
 
-                instruction_initialise_print_data_assembly_code = print_data_label + \
-                    ": .asciz " + '"' + println3node.expression + '"' + "\n"
+                instruction_initialise_print_data_assembly_code = \
+                    f"{print_data_label}: .asciz \"{println3node.expression}\"\n"
 
             # Otherwise, lookup symbol table
             else:
 
-                if self.debug:
+                if __debug__ and self.debug:
                     sys.stdout.write("Converting println to assembly - Identifier detected.\n")
 
-                print_true_label = print_data_label + "_true"
-                instruction_initialise_print_true_assembly_code = print_true_label + \
-                    ': .asciz "true"\n'
+                print_true_label = f"{print_data_label}_true"
+                instruction_initialise_print_true_assembly_code = \
+                    f'{print_true_label}: .asciz "true"\n'
 
-                print_false_label = "d" + str(self.data_label_count) + "_false"
+                print_false_label = f"d{self.data_label_count}_false"
 
-                instruction_initialise_print_false_assembly_code = print_false_label + \
-                    ': .asciz "false"\n'
+                instruction_initialise_print_false_assembly_code = \
+                    f'{print_false_label}: .asciz "false"\n'
 
                 # Load boolean identifier
 
+                # Check if identifier is an argument
+                arg_register = self._check_if_in_arguments(
+                    println3node.expression
+                )
+
                 # Check if identifier is in register
                 identifier_in_register = self._check_if_in_register(
                     println3node.expression
                 )
 
-                if identifier_in_register:
+                if arg_register:
+                    # Move value from argument register to a1, which is
+                    # saved on the stack but not changed yet
+
+                    instruction_load_boolean = MoveRegisterInstruction(
+                        rd="a1",
+                        rn=arg_register
+                    )
+
+                elif identifier_in_register:
                     # Move value from existing register to a1
 
                     instruction_load_boolean = MoveRegisterInstruction(
@@ -1775,10 +1920,11 @@ class Compiler:
 
                 else:
                     # Load value from stack
-                    try:
-                        identifier_offset = self._get_variable_offset(
-                            println3node.expression
-                        )
+                    identifier_offset = self._get_variable_offset(
+                        println3node.expression
+                    )
+
+                    if identifier_offset is not None:
 
                         instruction_load_boolean = LoadInstruction(
                             rd="a1",
@@ -1786,7 +1932,7 @@ class Compiler:
                             offset=-identifier_offset
                         )
 
-                    except:
+                    else:
 
                         # Calculate offset of class attribute in object
 
@@ -1803,27 +1949,14 @@ class Compiler:
                             offset=class_attribute_offset
                         )
 
-        instruction_load_print_data=None
-        if println3node.type == BasicType.BOOL and \
+        if println_type is BasicType.BOOL and \
             not println3node.is_raw_value:
 
-            instruction_initialise_print_true = Instruction(
-                instruction=instruction_initialise_print_true_assembly_code,
-            )
-
-            instruction_initialise_print_false = Instruction(
-                instruction=instruction_initialise_print_false_assembly_code,
-            )
-
-
-            self._link_instructions([
-                instruction_initialise_print_true,
-                instruction_initialise_print_false
+            self.data_lines.extend([
+                instruction_initialise_print_true_assembly_code,
+                instruction_initialise_print_false_assembly_code
             ])
 
-            self.instruction_data_tail.insert_child(instruction_initialise_print_true)
-            self.instruction_data_tail = instruction_initialise_print_false
-
             # Get value of boolean identifier
 
             # If true, get true label. If false, get false label
@@ -1837,8 +1970,7 @@ class Compiler:
 
             # If true, value is 0/False branch
 
-            false_branch_label = "." + println3node.value + "_" + \
-                print_false_label + 'False'
+            false_branch_label = f".{println3node.value}_{print_false_label}False"
 
             instruction_go_to_false_branch = ConditionalBranchInstruction(
                 operator="==",
@@ -1854,8 +1986,7 @@ class Compiler:
 
             # Branch to exit
 
-            true_branch_label = "." + println3node.value + "_" + print_true_label + \
-                "_exit"
+            true_branch_label = f".{println3node.value}_{print_true_label}_exit"
 
             instruction_branch_exit = UnconditionalBranchInstruction(
                 label=true_branch_label
@@ -1880,8 +2011,7 @@ class Compiler:
                 label=true_branch_label
             )
 
-            self._link_instructions([
-                current_instruction,
+            print_value_instructions = [
                 instruction_load_boolean,
                 instruction_compare_boolean_with_false,
                 instruction_go_to_false_branch,
@@ -1890,81 +2020,51 @@ class Compiler:
                 instruction_false_branch,
                 instruction_load_false,
                 instruction_exit_label
-            ])
-
-            instruction_load_print_value = instruction_exit_label
-
-        elif not (println3node.type == BasicType.STRING and not println3node.is_raw_value):
+            ]
 
-            instruction_initialise_print_data = Instruction(
-                instruction=instruction_initialise_print_data_assembly_code,
-            )
+        elif not (println_type is BasicType.STRING and not println3node.is_raw_value):
 
-            self.instruction_data_tail.insert_child(instruction_initialise_print_data)
-            self.instruction_data_tail = instruction_initialise_print_data
+            self.data_lines.append(instruction_initialise_print_data_assembly_code)
 
             instruction_load_print_data = LoadInstruction(
                 rd="a1",
-                label=print_data_label,
-                parent=current_instruction
+                label=print_data_label
             )
 
-        if current_instruction and instruction_load_print_data:
-            current_instruction.set_child(instruction_load_print_data)
-
-        if instruction_load_print_data:
-            # No need for additional loading for string identifier
-            self._link_instructions([
+            print_value_instructions = [
                 instruction_load_print_data,
                 instruction_load_print_value
-            ])
+            ]
 
-        instruction_printf = BranchLinkInstruction(
-            label="printf"
-        )
+        else:
 
-        self._link_instructions([
-            instruction_load_print_value,
-            instruction_printf
-        ])
+            # No need for additional loading for string identifier
+            print_value_instructions = [instruction_load_print_value]
 
         # Pop argument registers onto the stack to save argument values
         # in case there are nested function calls
 
         instruction_save_arg_registers = Instruction(
-            instruction="stmfd sp!,{a1,a2,a3,a4}\n"
+            instruction=SAVE_ARG_REGISTERS
+        )
+
+        instruction_printf = BranchLinkInstruction(
+            label="printf"
         )
 
         # Restore argument registers from stack to restore argument values
         # after nested function call
 
         instruction_pop_arg_registers = Instruction(
-            instruction="ldmfd sp!,{a1,a2,a3,a4}\n"
+            instruction=RESTORE_ARG_REGISTERS
         )
 
-        if println3node.type == BasicType.BOOL and \
-            not println3node.is_raw_value:
-
-            self._link_instructions([
-                instruction_save_arg_registers,
-                instruction_load_boolean
-            ])
-
-        elif instruction_load_print_data:
-
-            self._link_instructions([
-                instruction_save_arg_registers,
-                instruction_load_print_data
-            ])
-
-        else:
-
-            self._link_instructions([
-                instruction_save_arg_registers,
-                instruction_load_print_value
-            ])
+        # Statements are not linked to one another, so the whole println is
+        # linked here at once and returned by its first instruction
 
         self._link_instructions([
+            instruction_save_arg_registers,
+            *print_value_instructions,
             instruction_printf,
             instruction_pop_arg_registers
         ])
@@ -1973,1227 +2073,977 @@ class Compiler:
 
         return instruction_save_arg_registers
 
-    def _convert_assignment_to_assembly(
+    def _convert_class_instance_assignment_to_assembly(
         self,
         assignment3node: Assignment3Node,
         md_args: List[str],
-        liveness_data: Dict[str, List[int]]
+        registers: Dict[str, Any],
+        x_register: str
     ) -> "Instruction":
 
-        new_instruction: Any
-        store_instruction: Any
-        var_fp_offset: Any
+        #  x = new Object
 
-        if self.debug:
-            sys.stdout.write("Converting stmt to assembly - Assignment\n")
+        # Get the space required for object
+        space_required = self._get_space_required_for_object(
+            assignment3node.assigned_value.target_class
+        )
 
-        registers = self._get_registers(
-            assignment3node,
-            md_args,
-            liveness_data
+        # Set argument register to the space required
+        instruction_create_space = MoveImmediateInstruction(
+            rd="a1",
+            immediate=space_required
         )
 
-        required_registers = self._get_required_registers(
-            assignment3node
+        # Create space in memory
+        instruction_malloc = BranchLinkInstruction(
+            instruction="bl malloc\n",
+            label="malloc"
         )
 
-        if self.debug:
-            sys.stdout.write("Registers obtained: " + str(registers) + \
-                "\n")
+        # Restore argument registers from stack to restore argument values
+        # after creating object
 
-        x_is_arg = self._check_if_in_arguments(
-            assignment3node.identifier,
-            md_args
+        instruction_save_arg_registers = Instruction(
+            instruction=SAVE_ARG_REGISTERS
         )
 
-        if type(assignment3node.identifier) == ClassAttribute3Node:
+        instruction_pop_arg_registers = Instruction(
+            instruction=RESTORE_ARG_REGISTERS
+        )
 
-            # Manually override with y register for class attribute
-            # Need to guarantee register for base address of object is different
-            # from register for value to assign
-            x_register = registers['y'][0]
+        # Get offset of object
 
-        else:
-            x_register = registers['x'][0]
+        if __debug__ and self.debug:
+            sys.stdout.write("Address descriptor: " + str(self.address_descriptor) + "\n")
 
-        is_simple_assignment = assignment3node.assigned_value_is_raw_value
 
-        if is_simple_assignment:
+        try:
+            object_offset = self.md_var_offsets[
+                assignment3node.identifier
+            ]
 
-            if type(assignment3node.assigned_value) == IR3Node:
-                assigned_value = assignment3node.assigned_value.value
+            # Store address returned in stack
 
-            else:
-                assigned_value = assignment3node.assigned_value
+            instruction_store_base_address = StoreInstruction(
+                rd="a1",
+                base_offset="fp",
+                offset=-object_offset
+            )
 
-            if assignment3node.type in [BasicType.INT, BasicType.BOOL]:
+            self._link_instructions([
+                instruction_save_arg_registers,
+                instruction_create_space,
+                instruction_malloc,
+                instruction_store_base_address,
+                instruction_pop_arg_registers
+            ])
 
-                if assignment3node.type == BasicType.INT:
+        except:
 
-                    # x = CONSTANT
-                    new_instruction = MoveImmediateInstruction(
-                        rd=x_register,
-                        immediate=assigned_value
-                    )
-
-                elif assignment3node.type == BasicType.BOOL:
-
-                    if assigned_value == 'true':
-
-                        new_instruction = MoveNegateImmediateInstruction(
-                            rd=x_register,
-                            immediate=0
-                        )
-
-                    elif assigned_value == 'false':
-
-                        new_instruction = MoveImmediateInstruction(
-                            rd=x_register,
-                            immediate=0
-                        )
-
-            elif assignment3node.type == BasicType.STRING:
-
-                string_data_label = "d" + str(self.data_label_count)
-                self.data_label_count += 1
-
-                if self.debug:
-                    sys.stdout.write("Converting assignment to assembly - Raw string: " + \
-                        str(assigned_value) + "\n")
+            if assignment3node.identifier_is_class_attribute:
 
-                instruction_initialise_string_data_assembly_code = string_data_label + \
-                    ": .asciz " + assigned_value[:-1] + '"' + "\n"
-
-                instruction_add_string_to_data = Instruction(
-                    instruction=instruction_initialise_string_data_assembly_code
+                class_attribute_offset = self._calculate_class_attribute_offset(
+                    class_name=assignment3node.identifier.class_name,
+                    attribute_name=assignment3node.identifier.target_attribute
                 )
 
-                self.instruction_data_tail.insert_child(instruction_add_string_to_data)
-                self.instruction_data_tail = instruction_add_string_to_data
-
-                self._update_label(
-                    identifier=assignment3node.identifier,
-                    label=string_data_label
-                )
-
-                new_instruction = LoadInstruction(
+                instruction_load_class_instance_address = LoadInstruction(
                     rd=x_register,
-                    label=string_data_label
-                )
-
-            else:
-
-                if self.debug:
-                    sys.stdout.write("Converting stmt to assembly - Assignment - node type: " + \
-                        str(assignment3node.type) + "\n")
-
-                new_instruction = Instruction(
-                    instruction="Error in simple assignment.\n"
+                    base_offset="sp",
+                    offset=0
                 )
 
-        elif type(assignment3node.assigned_value) == ClassInstance3Node:
-
-            #  x = new Object
-
-            # Get the space required for object
-            space_required = self._get_space_required_for_object(
-                assignment3node.assigned_value.target_class
-            )
-
-            # Set argument register to the space required
-            instruction_create_space = MoveImmediateInstruction(
-                rd="a1",
-                immediate=space_required
-            )
-
-            # Create space in memory
-            instruction_malloc = BranchLinkInstruction(
-                instruction="bl malloc\n",
-                label="malloc"
-            )
-
-            # Restore argument registers from stack to restore argument values
-            # after creating object
-
-            instruction_save_arg_registers = Instruction(
-                instruction="stmfd sp!,{a1,a2,a3,a4}\n"
-            )
-
-            instruction_pop_arg_registers = Instruction(
-                instruction="ldmfd sp!,{a1,a2,a3,a4}\n"
-            )
-
-            # Get offset of object
-
-            if self.debug:
-                sys.stdout.write("Address descriptor: " + str(self.address_descriptor) + "\n")
-
-
-            try:
-                object_offset = self.address_descriptor[
-                    assignment3node.identifier
-                ]['offset']
-
-                # Store address returned in stack
-
                 instruction_store_base_address = StoreInstruction(
                     rd="a1",
-                    base_offset="fp",
-                    offset=-object_offset
+                    base_offset=x_register,
+                    offset=class_attribute_offset
                 )
 
                 self._link_instructions([
                     instruction_save_arg_registers,
                     instruction_create_space,
                     instruction_malloc,
+                    instruction_load_class_instance_address,
                     instruction_store_base_address,
                     instruction_pop_arg_registers
                 ])
 
-            except:
-
-                if type(assignment3node.identifier) == ClassAttribute3Node:
-
-                    class_attribute_offset = self._calculate_class_attribute_offset(
-                        class_name=assignment3node.identifier.class_name,
-                        attribute_name=assignment3node.identifier.target_attribute
-                    )
-
-                    instruction_load_class_instance_address = LoadInstruction(
-                        rd=x_register,
-                        base_offset="sp",
-                        offset=0
-                    )
-
-                    instruction_store_base_address = StoreInstruction(
-                        rd="a1",
-                        base_offset=x_register,
-                        offset=class_attribute_offset
-                    )
-
-                    self._link_instructions([
-                        instruction_save_arg_registers,
-                        instruction_create_space,
-                        instruction_malloc,
-                        instruction_load_class_instance_address,
-                        instruction_store_base_address,
-                        instruction_pop_arg_registers
-                    ])
-
-                else:
-
-                    pass
+            else:
 
-            new_instruction = instruction_save_arg_registers
+                pass
 
-        elif type(assignment3node.assigned_value) == UnaryOp3Node:
+        new_instruction = instruction_save_arg_registers
 
-            # x = -y
-            # x = !y
+        return new_instruction
 
-            if self.debug:
-                sys.stdout.write("Converting stmt to assembly - Assignment - " + \
-                    "x = unaryop y\n")
+    def _convert_unary_op_assignment_to_assembly(
+        self,
+        assignment3node: Assignment3Node,
+        md_args: List[str],
+        registers: Dict[str, Any],
+        x_register: str
+    ) -> "Instruction":
 
-            # Get register for y
-            # No need to check if y is raw value because IR3 code uses identifiers
-            # only for UnaryOp3Node
+        assigned_value = assignment3node.assigned_value
 
-            y_reg = registers['y'][0]
+        # x = -y
+        # x = !y
 
-            if self.debug:
-                sys.stdout.write("Unary op - y register: " + str(y_reg) + "\n")
+        if __debug__ and self.debug:
+            sys.stdout.write("Converting stmt to assembly - Assignment - " + \
+                "x = unaryop y\n")
 
-            if (assignment3node.type == BasicType.INT and \
-                    assignment3node.assigned_value.operator == '-'):
+        # Get register for y
+        # No need to check if y is raw value because IR3 code uses identifiers
+        # only for UnaryOp3Node
 
-                var_y_offset = self.address_descriptor[
-                    assignment3node.assigned_value.operand
-                ]['offset']
+        y_reg = registers['y'][0]
 
-                instruction_load_y_value = LoadInstruction(
-                    rd=y_reg,
-                    base_offset="fp",
-                    offset=-var_y_offset
-                )
+        if __debug__ and self.debug:
+            sys.stdout.write("Unary op - y register: " + str(y_reg) + "\n")
 
-                instruction_not_y_value = NegationInstruction(
-                    rd=x_register,
-                    rn=y_reg
-                )
+        if (assignment3node.type == BasicType.INT and \
+                assigned_value.operator == '-'):
 
-                self._link_instructions([
-                    instruction_load_y_value,
-                    instruction_not_y_value
-                ])
+            var_y_offset = self.md_var_offsets[
+                assigned_value.operand
+            ]
 
-                self._update_descriptors(
-                    register=y_reg,
-                    identifier=assignment3node.assigned_value.operand
-                )
+            instruction_load_y_value = LoadInstruction(
+                rd=y_reg,
+                base_offset="fp",
+                offset=-var_y_offset
+            )
 
-                new_instruction = instruction_load_y_value
+            instruction_not_y_value = NegationInstruction(
+                rd=x_register,
+                rn=y_reg
+            )
 
-            elif (assignment3node.type == BasicType.BOOL and \
-                    assignment3node.assigned_value.operator) == '!':
+            self._link_instructions([
+                instruction_load_y_value,
+                instruction_not_y_value
+            ])
 
-                var_y_is_arg = self._check_if_in_arguments(
-                    assignment3node.assigned_value.operand,
-                    md_args
-                )
+            self._update_descriptors(
+                register=y_reg,
+                identifier=assigned_value.operand
+            )
 
-                if self.debug:
+            new_instruction = instruction_load_y_value
 
-                    sys.stdout.write("Unary op - check if y is in arg: " + \
-                        str(var_y_is_arg) + "\n")
+        elif (assignment3node.type == BasicType.BOOL and \
+                assigned_value.operator) == '!':
 
-                if var_y_is_arg:
+            var_y_is_arg = self._check_if_in_arguments(
+                assigned_value.operand
+            )
 
-                    instruction_load_y_value = MoveRegisterInstruction(
-                        rd=y_reg,
-                        rn=var_y_is_arg
-                    )
+            if __debug__ and self.debug:
 
-                else:
-                    var_y_offset = self.address_descriptor[
-                        assignment3node.assigned_value.operand
-                    ]['offset']
+                sys.stdout.write("Unary op - check if y is in arg: " + \
+                    str(var_y_is_arg) + "\n")
 
-                    instruction_load_y_value = LoadInstruction(
-                        rd=y_reg,
-                        base_offset="fp",
-                        offset=-var_y_offset
-                    )
+            if var_y_is_arg:
 
-                instruction_negate_y_value = MoveNegateInstruction(
-                    rd=x_register,
-                    rn=y_reg
+                instruction_load_y_value = MoveRegisterInstruction(
+                    rd=y_reg,
+                    rn=var_y_is_arg
                 )
 
-                self._link_instructions([
-                    instruction_load_y_value,
-                    instruction_negate_y_value
-                ])
+            else:
+                var_y_offset = self.md_var_offsets[
+                    assigned_value.operand
+                ]
 
-                self._update_descriptors(
-                    register=y_reg,
-                    identifier=assignment3node.assigned_value.operand
+                instruction_load_y_value = LoadInstruction(
+                    rd=y_reg,
+                    base_offset="fp",
+                    offset=-var_y_offset
                 )
 
-                new_instruction = instruction_load_y_value
-
-        elif type(assignment3node.assigned_value) == BinOp3Node:
-
-            # x = y + z
-            if self.debug:
-                sys.stdout.write("Converting stmt to assembly - Assignment - " + \
-                    "x = y + z\n")
-
-            # Check if y is raw value
-
-            y_is_arg = self._check_if_in_arguments(
-                assignment3node.assigned_value.left_operand,
-                md_args
+            instruction_negate_y_value = MoveNegateInstruction(
+                rd=x_register,
+                rn=y_reg
             )
 
-            y_is_raw = assignment3node.assigned_value.left_operand_is_raw_value
-
-            y_value = assignment3node.assigned_value.left_operand
-            if not y_is_raw:
-                y_value = registers['y'][0]
-
-            # Check if z is raw value
+            self._link_instructions([
+                instruction_load_y_value,
+                instruction_negate_y_value
+            ])
 
-            z_is_arg = self._check_if_in_arguments(
-                assignment3node.assigned_value.right_operand,
-                md_args
+            self._update_descriptors(
+                register=y_reg,
+                identifier=assigned_value.operand
             )
 
-            z_is_raw = assignment3node.assigned_value.right_operand_is_raw_value
-
-            z_value = assignment3node.assigned_value.right_operand
-            if not z_is_raw:
-                z_value = registers['z'][0]
-
-            # Actual assignment
-
-            if (assignment3node.type == BasicType.INT and \
-                    assignment3node.assigned_value.operator != '/') or \
-                assignment3node.type == BasicType.BOOL:
-
-                if assignment3node.type == BasicType.BOOL:
-
-                    # Convert raw values if any
-                    if y_is_raw:
-                        y_value = 0
+            new_instruction = instruction_load_y_value
 
-                    if z_is_raw:
-                        z_value = 0
+        return new_instruction
 
-                if self.debug:
-                    sys.stdout.write("Converting stmt to assembly - Assignment - " + \
-                        "x = y + z - Plus operator" + "\n")
+    def _load_binop_operand(
+        self,
+        operand: str,
+        register: str,
+        arg_register: Optional[str]
+    ) -> Optional["Instruction"]:
 
-                if y_is_raw:
-                    # If y is a raw value
-                    if self.debug:
-                        sys.stdout.write("Converting stmt to assembly - Assignment - " + \
-                            "x = y + z - Loading z" + "\n")
+        # Load an operand of x = y op z from the stack into its register. An
+        # argument is read in place from the register it was passed in, so no
+        # copy is made and nothing is returned. The caller records the loaded
+        # identifiers in the descriptors once all operands are loaded.
 
-                    instruction_load_mul_raw_y = None
-                    z_reg_identifier = assignment3node.assigned_value.right_operand
-                    if assignment3node.assigned_value.operator == '*':
+        if arg_register:
+            return None
 
-                        z_reg_identifier = 'placeholder'
+        return LoadInstruction(
+            rd=register,
+            base_offset="fp",
+            offset=-self.md_var_offsets[operand]
+        )
 
-                        instruction_load_mul_raw_y = MoveImmediateInstruction(
-                            rd=registers['y'][0],
-                            immediate=y_value
-                        )
+    def _load_relop_operand(
+        self,
+        operand: str,
+        register: str
+    ) -> Optional["Instruction"]:
 
-                        instruction_binop = DualOpInstruction(
-                            operator=assignment3node.assigned_value.operator,
-                            rd=x_register,
-                            rn=z_value,
-                            rm=registers['y'][0]
-                        )
+        # Load an operand of a relational expression into its register. An
+        # argument is copied from the register it was passed in. Nothing is
+        # loaded if the register was allocated because it already holds the
+        # operand, as it is then excluded from the other operands.
 
-                        self._link_instructions([
-                            instruction_load_mul_raw_y,
-                            instruction_binop
-                        ])
+        arg_register = self._check_if_in_arguments(operand)
 
-                    else:
+        if arg_register:
+            return MoveRegisterInstruction(
+                rd=register,
+                rn=arg_register
+            )
 
-                        instruction_binop = DualOpInstruction(
-                            operator=assignment3node.assigned_value.operator,
-                            rd=x_register,
-                            rn=z_value,
-                            immediate=y_value
-                        )
+        register_index = REGISTER_INDEX.get(register)
 
-                    if not z_is_arg:
+        if register_index is not None and \
+            self.register_descriptor[register_index] == operand:
+            return None
 
-                        # If z is not an argument, load z
+        return LoadInstruction(
+            rd=register,
+            base_offset="fp",
+            offset=-self.md_var_offsets[operand]
+        )
 
-                        var_z_offset = self.address_descriptor[assignment3node.assigned_value.right_operand]['offset']
+    def _convert_binop_assignment_to_assembly(
+        self,
+        assignment3node: Assignment3Node,
+        md_args: List[str],
+        registers: Dict[str, Any],
+        x_register: str
+    ) -> "Instruction":
 
-                        new_instruction = LoadInstruction(
-                            rd=z_value,
-                            base_offset="fp",
-                            offset=-var_z_offset
-                        )
+        assigned_value = assignment3node.assigned_value
 
-                        self._update_descriptors(
-                            register=z_value,
-                            identifier=z_reg_identifier
-                        )
+        operator = assigned_value.operator
+        y_operand = assigned_value.left_operand
+        z_operand = assigned_value.right_operand
 
-                        if instruction_load_mul_raw_y:
+        # x = y + z
+        if __debug__ and self.debug:
+            sys.stdout.write("Converting stmt to assembly - Assignment - " + \
+                "x = y + z\n")
 
-                            self._link_instructions([
-                                new_instruction,
-                                instruction_load_mul_raw_y
-                            ])
+        # Check if y is raw value
 
+        y_is_arg = self._check_if_in_arguments(
+            y_operand
+        )
 
-                        else:
+        y_is_raw = assigned_value.left_operand_is_raw_value
 
-                            self._link_instructions([
-                                new_instruction,
-                                instruction_binop
-                            ])
+        y_value = y_operand
+        if not y_is_raw:
+            y_value = registers['y'][0]
 
-                    elif z_is_arg:
+        # Check if z is raw value
 
-                        # If z is an argument, load z from the argument register
-                        # to the assigned register
+        z_is_arg = self._check_if_in_arguments(
+            z_operand
+        )
 
-                        instruction_move_from_argument_register = MoveRegisterInstruction(
-                            rd=z_value,
-                            rn=z_is_arg
-                        )
+        z_is_raw = assigned_value.right_operand_is_raw_value
 
-                        self._update_descriptors(
-                            register=z_value,
-                            identifier=z_is_arg
-                        )
+        z_value = z_operand
+        if not z_is_raw:
+            z_value = registers['z'][0]
 
+        # Actual assignment
 
-                        if instruction_load_mul_raw_y:
+        if (assignment3node.type == BasicType.INT and \
+                operator != '/') or \
+            assignment3node.type == BasicType.BOOL:
 
-                            self._link_instructions([
-                                instruction_move_from_argument_register,
-                                instruction_load_mul_raw_y
-                            ])
+            if assignment3node.type == BasicType.BOOL:
 
-                        else:
+                # Convert raw values if any
+                if y_is_raw:
+                    y_value = 0
 
-                            self._link_instructions([
-                                instruction_move_from_argument_register,
-                                instruction_binop
-                            ])
+                if z_is_raw:
+                    z_value = 0
 
-                        new_instruction = instruction_move_from_argument_register
+            if __debug__ and self.debug:
+                sys.stdout.write("Converting stmt to assembly - Assignment - " + \
+                    "x = y + z - Plus operator" + "\n")
 
-                elif z_is_raw:
+            if y_is_raw or z_is_raw:
 
-                    # If z is a raw value
-                    if self.debug:
-                        sys.stdout.write("Converting stmt to assembly - Assignment - " + \
-                            "x = y + z - Loading z" + "\n")
+                # One operand is a raw value and only the other is loaded
 
-                    instruction_load_mul_raw_z = None
-                    y_reg_identifier = assignment3node.assigned_value.left_operand
-                    if assignment3node.assigned_value.operator == '*':
+                if y_is_raw:
+                    raw_value, raw_key = y_value, 'y'
+                    operand, operand_register, operand_is_arg = z_operand, z_value, z_is_arg
 
-                        y_reg_identifier = 'placeholder'
+                else:
+                    raw_value, raw_key = z_value, 'z'
+                    operand, operand_register, operand_is_arg = y_operand, y_value, y_is_arg
 
-                        instruction_load_mul_raw_z = MoveImmediateInstruction(
-                            rd=registers['z'][0],
-                            immediate=z_value
-                        )
+                if __debug__ and self.debug:
+                    sys.stdout.write("Converting stmt to assembly - Assignment - " + \
+                        "x = y + z - Loading " + str(operand) + "\n")
 
-                        instruction_binop = DualOpInstruction(
-                            operator=assignment3node.assigned_value.operator,
-                            rd=x_register,
-                            rn=y_value,
-                            rm=registers['z'][0]
-                        )
+                if operator == '*':
+                    operand_identifier = 'placeholder'
 
-                        self._link_instructions([
-                            instruction_load_mul_raw_z,
-                            instruction_binop
-                        ])
+                else:
+                    operand_identifier = operand
 
-                    else:
+                instruction_load_operand = self._load_binop_operand(
+                    operand,
+                    operand_register,
+                    operand_is_arg
+                )
 
-                        instruction_binop = DualOpInstruction(
-                            operator=assignment3node.assigned_value.operator,
-                            rd=x_register,
-                            rn=y_value,
-                            immediate=z_value
-                        )
+                if instruction_load_operand:
+                    self._update_descriptors(
+                        register=operand_register,
+                        identifier=operand_identifier
+                    )
 
-                    if not y_is_arg:
+                if operand_is_arg:
+                    operand_register = operand_is_arg
 
-                        # If y is not an argument, load y
+                if operator == '*':
 
-                        var_y_offset = self.address_descriptor[assignment3node.assigned_value.left_operand]['offset']
+                    # mul does not take an immediate, so move the raw value
+                    # into its own register first
 
-                        new_instruction = LoadInstruction(
-                            rd=y_value,
-                            base_offset="fp",
-                            offset=-var_y_offset
-                        )
+                    raw_register = registers[raw_key][0]
 
-                        self._update_descriptors(
-                            register=y_value,
-                            identifier=y_reg_identifier
-                        )
+                    instruction_load_mul_raw_value = MoveImmediateInstruction(
+                        rd=raw_register,
+                        immediate=raw_value
+                    )
 
-                        if instruction_load_mul_raw_z:
+                    self._update_descriptors(
+                        register=raw_register,
+                        identifier='placeholder'
+                    )
 
-                            self._link_instructions([
-                                new_instruction,
-                                instruction_load_mul_raw_z
-                            ])
+                    instruction_binop = DualOpInstruction(
+                        operator=operator,
+                        rd=x_register,
+                        rn=operand_register,
+                        rm=raw_register
+                    )
 
-                        else:
+                    binop_instructions = [
+                        instruction_load_mul_raw_value,
+                        instruction_binop
+                    ]
 
-                            self._link_instructions([
-                                new_instruction,
-                                instruction_binop
-                            ])
+                else:
 
-                    elif y_is_arg:
+                    instruction_binop = DualOpInstruction(
+                        operator=operator,
+                        rd=x_register,
+                        rn=operand_register,
+                        immediate=raw_value
+                    )
 
-                        # If z is a raw value, load y
+                    binop_instructions = [instruction_binop]
 
-                        instruction_move_from_argument_register = MoveRegisterInstruction(
-                            rd=y_value,
-                            rn=y_is_arg
-                        )
+                if instruction_load_operand:
+                    binop_instructions.insert(0, instruction_load_operand)
 
-                        self._update_descriptors(
-                            register=y_value,
-                            identifier=y_is_arg
-                        )
+                self._link_instructions(binop_instructions)
 
-                        if instruction_load_mul_raw_z:
+                new_instruction = binop_instructions[0]
 
-                            self._link_instructions([
-                                instruction_move_from_argument_register,
-                                instruction_load_mul_raw_z
-                            ])
+            else:
 
-                        else:
+                # Load y and z
+                if __debug__ and self.debug:
+                    sys.stdout.write("Converting stmt to assembly - Assignment - " + \
+                        "x = y + z - Loading y and z - register y: " + y_value + \
+                        ", register z: " + z_value + "\n")
 
-                            self._link_instructions([
-                                instruction_move_from_argument_register,
-                                instruction_binop
-                            ])
+                instruction_load_y = self._load_binop_operand(
+                    y_operand, y_value, y_is_arg
+                )
 
-                        new_instruction = instruction_move_from_argument_register
+                instruction_load_z = self._load_binop_operand(
+                    z_operand, z_value, z_is_arg
+                )
 
-                else:
+                self._update_multiple_descriptors([
+                    (register, operand)
+                    for instruction_load, register, operand in (
+                        (instruction_load_y, y_value, y_operand),
+                        (instruction_load_z, z_value, z_operand),
+                    )
+                    if instruction_load
+                ])
 
-                    # Load y and z
-                    if self.debug:
-                        sys.stdout.write("Converting stmt to assembly - Assignment - " + \
-                            "x = y + z - Loading y and z" + "\n")
+                instruction_binop = DualOpInstruction(
+                    operator=operator,
+                    rd=x_register,
+                    rn=y_is_arg or y_value,
+                    rm=z_is_arg or z_value
+                )
 
-                    if not y_is_arg and not z_is_arg:
+                binop_instructions = [
+                    i for i in (instruction_load_y, instruction_load_z, instruction_binop)
+                    if i
+                ]
 
-                        if self.debug:
-                            sys.stdout.write("Converting stmt to assembly - Assignment - " + \
-                                "x = y + z - Loading y and z - Both not args" + "\n")
+                self._link_instructions(binop_instructions)
 
-                        if self.debug:
-                            sys.stdout.write("Converting stmt to assembly - Assignment - " + \
-                                "x = y + z - Loading y and z - Both not args - register y: " + \
-                                y_value + "\n")
+                new_instruction = binop_instructions[0]
 
-                        if self.debug:
-                            sys.stdout.write("Converting stmt to assembly - Assignment - " + \
-                                "x = y + z - Loading y and z - Both not args - register z: " + \
-                                z_value + "\n")
+        else:
 
-                        var_y_offset = self.address_descriptor[assignment3node.assigned_value.left_operand]['offset']
+            # Placeholder: Handle string concatenation and integer division
 
-                        new_instruction = LoadInstruction(
-                            rd=y_value,
-                            base_offset="fp",
-                            offset=-var_y_offset
-                        )
+            if __debug__ and self.debug:
+                sys.stdout.write("Converting stmt to assembly - Assignment - " + \
+                    "String concatenation and integer division are not handled" + "\n")
 
-                        self._update_descriptors(
-                            register=y_value,
-                            identifier=assignment3node.assigned_value.left_operand
-                        )
+            new_instruction = Instruction(
+                instruction="String concatenation and integer division are not handled\n"
+            )
 
-                        var_z_offset = self.address_descriptor[assignment3node.assigned_value.right_operand]['offset']
+        # No spill stores are needed when a register is taken over: every
+        # assignment stores its result to the stack, so registers only hold
+        # copies of values that are already in memory
 
-                        instruction_load_z = LoadInstruction(
-                            rd=z_value,
-                            base_offset="fp",
-                            offset=-var_z_offset
-                        )
+        if __debug__ and self.debug:
+            sys.stdout.write("Registers obtained: " + str(registers) + ".\n")
 
-                        self._update_descriptors(
-                            register=z_value,
-                            identifier=assignment3node.assigned_value.right_operand
-                        )
+        return new_instruction
 
+    def _convert_relop_assignment_to_assembly(
+        self,
+        assignment3node: Assignment3Node,
+        md_args: List[str],
+        registers: Dict[str, Any],
+        x_register: str
+    ) -> "Instruction":
 
-                        instruction_binop = DualOpInstruction(
-                            operator=assignment3node.assigned_value.operator,
-                            rd=x_register,
-                            rn=y_value,
-                            rm=z_value
-                        )
+        assigned_value = assignment3node.assigned_value
 
-                        self._link_instructions([
-                            new_instruction,
-                            instruction_load_z,
-                            instruction_binop
-                        ])
+        # The result is written to the x register even when the assignment
+        # targets a class attribute, so it is read from registers
+        y_register = registers['y'][0]
+        z_register = registers['z'][0]
+        result_register = registers['x'][0]
 
-                    elif y_is_arg and not z_is_arg:
+        if __debug__ and self.debug:
+            sys.stdout.write("Converting stmt to assembly - RelOp.\n")
 
-                        if self.debug:
-                            sys.stdout.write("Converting stmt to assembly - Assignment - " + \
-                                "x = y + z - Loading y and z - Only y is arg" + "\n")
+        # Load operands that are not already in their registers
 
-                        instruction_move_from_argument_register = MoveRegisterInstruction(
-                            rd=y_value,
-                            rn=y_is_arg
-                        )
+        instructions_load_operands = []
 
-                        self._update_descriptors(
-                            register=y_value,
-                            identifier=assignment3node.assigned_value.left_operand
-                        )
+        for operand, register in (
+            (assigned_value.left_operand, y_register),
+            (assigned_value.right_operand, z_register),
+        ):
+            instruction_load_operand = self._load_relop_operand(
+                operand,
+                register
+            )
 
-                        var_z_offset = self.address_descriptor[assignment3node.assigned_value.right_operand]['offset']
+            if instruction_load_operand:
+                instructions_load_operands.append(instruction_load_operand)
 
-                        instruction_load_z = LoadInstruction(
-                            rd=z_value,
-                            base_offset="fp",
-                            offset=-var_z_offset
-                        )
+        self._update_multiple_descriptors((
+            (y_register, assigned_value.left_operand),
+            (z_register, assigned_value.right_operand),
+        ))
 
-                        self._update_descriptors(
-                            register=z_value,
-                            identifier=assignment3node.assigned_value.right_operand
-                        )
+        # Compare
 
-                        instruction_binop = DualOpInstruction(
-                            operator=assignment3node.assigned_value.operator,
-                            rd=x_register,
-                            rn=y_value,
-                            rm=z_value
-                        )
+        instruction_compare = CompareInstruction(
+            rd=y_register,
+            rn=z_register
+        )
 
-                        self._link_instructions([
-                            instruction_move_from_argument_register,
-                            instruction_load_z,
-                            instruction_binop
-                        ])
+        # If true, go to branch to set to True
 
-                        new_instruction = instruction_move_from_argument_register
+        branch_index = self.branch_count
+        self.branch_count += 1
 
-                    elif not y_is_arg and z_is_arg:
+        identifier = assignment3node.identifier
 
-                        if self.debug:
-                            sys.stdout.write("Converting stmt to assembly - Assignment - " + \
-                                "x = y + z - Loading y and z - Only z is arg" + "\n")
+        true_branch_label = f".{identifier}_true_{branch_index}"
+        exit_branch_label = f".{identifier}_exit_{branch_index}"
 
-                        instruction_move_from_argument_register = MoveRegisterInstruction(
-                            rd=z_value,
-                            rn=z_is_arg
-                        )
+        instruction_conditional_branch = ConditionalBranchInstruction(
+            operator=assigned_value.operator,
+            label=true_branch_label
+        )
 
-                        self._update_descriptors(
-                            register=z_value,
-                            identifier=assignment3node.assigned_value.right_operand
-                        )
+        # Otherwise, set to False and branch to exit
 
-                        var_y_offset = self.address_descriptor[assignment3node.assigned_value.left_operand]['offset']
+        instruction_set_value_to_false = MoveImmediateInstruction(
+            rd=result_register,
+            immediate=0
+        )
 
-                        instruction_load_y = LoadInstruction(
-                            rd=y_value,
-                            base_offset="fp",
-                            offset=-var_y_offset
-                        )
+        instruction_branch_exit = UnconditionalBranchInstruction(
+            label=exit_branch_label
+        )
 
-                        self._update_descriptors(
-                            register=y_value,
-                            identifier=assignment3node.assigned_value.left_operand
-                        )
+        # True branch
 
-                        instruction_move_from_argument_register.set_child(instruction_load_y)
+        instruction_true_branch_label = LabelInstruction(
+            label=true_branch_label
+        )
 
+        instruction_set_value_to_true = MoveNegateImmediateInstruction(
+            rd=result_register,
+            immediate=0
+        )
 
-                        instruction_binop = DualOpInstruction(
-                            operator=assignment3node.assigned_value.operator,
-                            rd=x_register,
-                            rn=y_value,
-                            rm=z_value
-                        )
+        # Exit branch label
 
-                        self._link_instructions([
-                            instruction_move_from_argument_register,
-                            instruction_load_y,
-                            instruction_binop
-                        ])
+        instruction_exit_label = LabelInstruction(
+            label=exit_branch_label
+        )
 
-                        new_instruction = instruction_move_from_argument_register
+        # Link instructions
 
-                    elif y_is_arg and z_is_arg:
+        self._link_instructions([
+            *instructions_load_operands,
+            instruction_compare,
+            instruction_conditional_branch,
+            instruction_set_value_to_false,
+            instruction_branch_exit,
+            instruction_true_branch_label,
+            instruction_set_value_to_true,
+            instruction_exit_label
+        ])
 
-                        if self.debug:
-                            sys.stdout.write("Converting stmt to assembly - Assignment - " + \
-                                "x = y + z - Loading y and z - Both args" + "\n")
+        new_instruction = instructions_load_operands[0] \
+            if instructions_load_operands else instruction_compare
 
-                        instruction_move_y_from_argument_register = MoveRegisterInstruction(
-                            rd=y_value,
-                            rn=y_is_arg
-                        )
+        return new_instruction
 
-                        self._update_descriptors(
-                            register=y_value,
-                            identifier=assignment3node.assigned_value.left_operand
-                        )
+    def _convert_method_call_assignment_to_assembly(
+        self,
+        assignment3node: Assignment3Node,
+        md_args: List[str],
+        registers: Dict[str, Any],
+        x_register: str
+    ) -> "Instruction":
 
-                        instruction_move_z_from_argument_register = MoveRegisterInstruction(
-                            rd=z_value,
-                            rn=z_is_arg
-                        )
+        method_call_node = assignment3node.assigned_value
 
-                        self._update_descriptors(
-                            register=z_value,
-                            identifier=assignment3node.assigned_value.right_operand
-                        )
+        if __debug__ and self.debug:
+            sys.stdout.write("Converting stmt to assembly - MethodCall3.\n")
 
-                        instruction_binop = DualOpInstruction(
-                            operator=assignment3node.assigned_value.operator,
-                            rd=x_register,
-                            rn=y_value,
-                            rm=z_value
-                        )
+        # Argument loads are collected and linked with the rest of the call
+        # once all arguments are converted
+        instructions_load_arguments = []
+        append_instruction_load_argument = instructions_load_arguments.append
 
-                        self._link_instructions([
-                            instruction_move_y_from_argument_register,
-                            instruction_move_z_from_argument_register,
-                            instruction_binop
-                        ])
+        # Move the base address of the class to a1
 
-                        new_instruction = instruction_move_y_from_argument_register
+        this_arg_identifier = method_call_node.arguments.value
 
-            else:
+        # If first argument is a reference to 'this', its base address is
+        # already in the first argument register, so no move is emitted
+        if this_arg_identifier != 'this':
+            base_address_offset = self.md_var_offsets[this_arg_identifier]
 
-                # Placeholder: Handle string concatenation and integer division
+            append_instruction_load_argument(LoadInstruction(
+                rd="a1",
+                base_offset="fp",
+                offset=-base_address_offset
+            ))
 
-                if self.debug:
-                    sys.stdout.write("Converting stmt to assembly - Assignment - " + \
-                        "String concatenation and integer division are not handled" + "\n")
+        # Collect the remaining arguments after the object first, so they
+        # are walked once and converted in a flat loop
+        method_call_args = []
+        next_arg = method_call_node.arguments.child
 
-                new_instruction = Instruction(
-                    instruction="String concatenation and integer division are not handled\n"
-                )
+        while next_arg:
+            method_call_args.append(next_arg)
+            next_arg = next_arg.child
 
-            # Check for spilling and store to stack beforehand by adding
-            # instruction at the top
+        # Bind the raw value loader lookup once rather than per argument
+        get_raw_argument_load_handler = self._raw_argument_load_handlers.get
 
-            if self.debug:
-                sys.stdout.write("Registers obtained: " + str(registers) + ".\n")
+        for arg_count, next_arg in enumerate(method_call_args, 1):
 
-            '''
-            for k, v in registers.items():
+            # For each argument, check if it is a raw value or an identifier
 
-                if v[1]:
+            next_arg_reg = ARG_REGISTERS[arg_count]
+            instruction_load_next_argument = None
 
-                    if self.debug:
-                        sys.stdout.write("Spilt register - Generating str instruction.\n")
+            if next_arg.is_raw_value:
+                # If raw value, move to register directly
 
-                    spilled_identifiers = self.register_descriptor[v[0]]
+                if __debug__ and self.debug:
+                    sys.stdout.write("Converting stmt to assembly - MethodCall3 - raw value arg detected.\n")
 
-                    stored_offsets = []
+                load_raw_argument = get_raw_argument_load_handler(next_arg.type)
 
-                    for s in spilled_identifiers:
+                if load_raw_argument:
+                    instruction_load_next_argument = load_raw_argument(
+                        next_arg,
+                        next_arg_reg
+                    )
 
-                        try:
-                            var_offset = self.address_descriptor[s]['offset']
+            else:
 
-                        except:
-                            var_offset = None
+                if type(next_arg) is ClassAttribute3Node:
+                    if __debug__ and self.debug:
+                        sys.stdout.write("Converting stmt to assembly - MethodCall3 - Class attribute arg detected.\n")
+                    pass
 
-                        if not var_offset:
+                else:
+                    if __debug__ and self.debug:
+                        sys.stdout.write("Converting stmt to assembly - MethodCall3 - Identifier arg detected: " +
+                            next_arg.value + "\n")
 
-                            # Placeholder value that can be spilled
+                    next_arg_in_reg = self._check_if_in_arguments(
+                        next_arg.value
+                    )
 
-                            pass
+                    if next_arg_in_reg:
 
-                        if var_offset and var_offset not in stored_offsets:
+                        # Since arguments have been pushed onto the stack,
+                        # retrieve arguments from the stack instead
+                        # with offset from stack pointer
 
-                            spill_instruction = Instruction(
-                                self._get_incremented_instruction_count(),
-                                instruction="strrrrrrrrr " + v[0] + ",[fp,#-" + \
-                                    str(var_offset) + "]\n"
-                            )
+                        arg_reg_stack_offset = ARG_REGISTER_TO_STACK_OFFSET[next_arg_in_reg]
 
-                            self._link_instructions([
-                                spill_instruction,
-                                new_instruction
-                            ])
+                        instruction_load_next_argument = LoadInstruction(
+                            rd=next_arg_reg,
+                            base_offset="sp",
+                            offset=arg_reg_stack_offset
+                        )
 
-                            new_instruction = spill_instruction
+                    else:
 
-                            stored_offsets.append(var_offset)
+                        # Otherwise, retrieve arguments from stack
+                        # with offset from frame pointer
 
-                    if self.debug:
-                        sys.stdout.write("Spilt register - str instruction added.\n")
+                        var_offset = self.md_var_offsets[next_arg.value]
 
-                    self._update_descriptors(
-                        register=v[0],
-                        identifier=required_registers[k]
-                    )
-        '''
+                        instruction_load_next_argument = LoadInstruction(
+                            rd=next_arg_reg,
+                            base_offset="fp",
+                            offset=-var_offset
+                        )
+                # move to an argument register
 
-        elif type(assignment3node.assigned_value) == RelOp3Node:
+            if instruction_load_next_argument:
+                append_instruction_load_argument(instruction_load_next_argument)
 
-            if self.debug:
-                sys.stdout.write("Converting stmt to assembly - RelOp.\n")
+        instruction_branch_to_function= BranchLinkInstruction(
+            label=self._get_method_label(method_call_node.method_id)
+        )
 
-            # Load first operand
+        instruction_move_return_value_to_x_register = MoveRegisterInstruction(
+            rd=x_register,
+            rn="a1"
+        )
 
-            var_y_is_arg = self._check_if_in_arguments(
-                assignment3node.assigned_value.left_operand,
-                md_args
-            )
+        # Pop argument registers onto the stack to save argument values
+        # in case there are nested function calls
 
-            if var_y_is_arg:
-                instruction_load_y_value = MoveRegisterInstruction(
-                    rd=registers['y'][0],
-                    rn=var_y_is_arg
-                )
+        instruction_save_arg_registers = Instruction(
+            instruction=SAVE_ARG_REGISTERS
+        )
 
-            else:
+        # Restore argument registers from stack to restore argument values
+        # after nested function call
 
-                var_y_offset = self.address_descriptor[
-                    assignment3node.assigned_value.left_operand
-                ]['offset']
+        instruction_pop_arg_registers = Instruction(
+            instruction=RESTORE_ARG_REGISTERS
+        )
 
-                instruction_load_y_value = LoadInstruction(
-                    rd=registers['y'][0],
-                    base_offset="fp",
-                    offset=-var_y_offset
-                )
+        self._link_instructions([
+            instruction_save_arg_registers,
+            *instructions_load_arguments,
+            instruction_branch_to_function,
+            instruction_move_return_value_to_x_register,
+            instruction_pop_arg_registers
+        ])
 
-            # Load second operand
+        new_instruction = instruction_save_arg_registers
 
-            var_z_is_arg = self._check_if_in_arguments(
-                assignment3node.assigned_value.right_operand,
-                md_args
-            )
+        return new_instruction
 
-            if var_z_is_arg:
-                instruction_load_z_value = MoveRegisterInstruction(
-                    rd=registers['z'][0],
-                    rn=var_z_is_arg
-                )
+    def _load_int_raw_argument(
+        self,
+        arg: IR3Node,
+        register: str
+    ) -> "Instruction":
 
-            else:
+        return MoveImmediateInstruction(
+            rd=register,
+            immediate=arg.value
+        )
 
-                var_z_offset = self.address_descriptor[
-                    assignment3node.assigned_value.right_operand
-                ]['offset']
+    def _load_string_raw_argument(
+        self,
+        arg: IR3Node,
+        register: str
+    ) -> "Instruction":
 
-                instruction_load_z_value = LoadInstruction(
-                    rd=registers['z'][0],
-                    base_offset="fp",
-                    offset=-var_z_offset
-                )
+        string_data_label = f"d{self.data_label_count}"
+        self.data_label_count += 1
 
-            # Compare
+        if __debug__ and self.debug:
+            sys.stdout.write("Converting stmt to assembly - MethodCall3 - String.\n")
 
-            instruction_compare = CompareInstruction(
-                rd=registers['y'][0],
-                rn=registers['z'][0]
-            )
+        instruction_initialise_string_data_assembly_code = \
+            f"{string_data_label}: .asciz {arg.value}\n"
 
-            # If true, go to branch to set to True
+        self.data_lines.append(instruction_initialise_string_data_assembly_code)
 
-            branch_index = self.branch_count
-            self.branch_count += 1
+        # No need to update labels because it is a string constant
+        # that will not be reused
 
-            true_branch_label = "." + str(assignment3node.identifier) + \
-                "_true_" + str(branch_index)
-            exit_branch_label = "." + str(assignment3node.identifier) + \
-                "_exit_" + str(branch_index)
+        return LoadInstruction(
+            rd=register,
+            label=string_data_label
+        )
 
-            instruction_conditional_branch = ConditionalBranchInstruction(
-                operator=assignment3node.assigned_value.operator,
-                label=true_branch_label
-            )
+    def _load_bool_raw_argument(
+        self,
+        arg: IR3Node,
+        register: str
+    ) -> Optional["Instruction"]:
 
-            # Otherwise, set to False and branch to exit
+        if arg.value == 'true':
 
-            instruction_set_value_to_false = MoveImmediateInstruction(
-                rd=registers['x'][0],
+            return MoveNegateImmediateInstruction(
+                rd=register,
                 immediate=0
             )
 
-            instruction_branch_exit = UnconditionalBranchInstruction(
-                label=exit_branch_label
-            )
-
-            # True branch
-
-            instruction_true_branch_label = LabelInstruction(
-                label=true_branch_label
-            )
+        elif arg.value == 'false':
 
-            instruction_set_value_to_true = MoveNegateImmediateInstruction(
-                rd=registers['x'][0],
+            return MoveImmediateInstruction(
+                rd=register,
                 immediate=0
             )
 
-            # Exit branch label
-
-            instruction_exit_label = LabelInstruction(
-                label=exit_branch_label
-            )
-
-            # Link instructions
-
-            self._link_instructions([
-                instruction_load_y_value,
-                instruction_load_z_value,
-                instruction_compare,
-                instruction_conditional_branch,
-                instruction_set_value_to_false,
-                instruction_branch_exit,
-                instruction_true_branch_label,
-                instruction_set_value_to_true,
-                instruction_exit_label
-            ])
-
-            new_instruction = instruction_load_y_value
-
-        elif type(assignment3node.assigned_value) == MethodCall3Node:
-
-            method_call_node = assignment3node.assigned_value
-
-            if self.debug:
-                sys.stdout.write("Converting stmt to assembly - MethodCall3.\n")
-
-            # Move the base address of the class to a1
-
-            this_arg_identifier = method_call_node.arguments.value
-
-            if this_arg_identifier == 'this':
-                # If first argument is a reference to 'this', retain the first argument register
-
-                instruction_load_arguments = MoveRegisterInstruction(
-                    rd="a1",
-                    rn="a1"
-                )
-
-            else:
-                base_address_offset = self.address_descriptor[this_arg_identifier]['offset']
-
-                instruction_load_arguments = LoadInstruction(
-                    rd="a1",
-                    base_offset="fp",
-                    offset=-base_address_offset
-                )
-
-            next_arg = method_call_node.arguments.child
-            arg_count = 1
-            completed = False
-            latest_instruction_load_argument = instruction_load_arguments
+        return None
 
-            while not completed:
+    def _load_class_attribute_base_address(
+        self,
+        class_attribute: ClassAttribute3Node,
+        register: str
+    ) -> Tuple["Instruction", Optional[int]]:
 
-                if not next_arg:
-                    completed = True
-                    break
+        # Load the base address of the object owning a class attribute into
+        # the register, and return the load with the attribute's offset in
+        # the object. The base address of 'this' is in the first argument
+        # register, and that of any other object is stored in the stack.
 
-                if next_arg:
+        if class_attribute.object_name == "this":
 
-                    # For each argument, check if it is a raw value or an identifier
+            instruction_load_base_address = MoveRegisterInstruction(
+                rd=register,
+                rn="a1"
+            )
 
-                    next_arg_reg = ARG_REGISTERS[arg_count]
+        else:
 
-                    if next_arg.is_raw_value:
-                        # If raw value, move to register directly
+            instruction_load_base_address = LoadInstruction(
+                rd=register,
+                base_offset="fp",
+                offset=-self.md_var_offsets[class_attribute.object_name]
+            )
 
-                        if self.debug:
-                            sys.stdout.write("Converting stmt to assembly - MethodCall3 - raw value arg detected.\n")
+        class_attribute_offset = self._calculate_class_attribute_offset(
+            ir3_node=class_attribute
+        )
 
-                        if next_arg.type == BasicType.INT:
-                            instruction_load_next_argument = MoveImmediateInstruction(
-                                rd=next_arg_reg,
-                                immediate=next_arg.value
-                            )
+        if __debug__ and self.debug:
+            sys.stdout.write("Converting stmt to assembly - class attribute " + \
+                str(class_attribute) + " offset: " + \
+                str(class_attribute_offset) + "\n")
 
-                        if next_arg.type == BasicType.STRING:
+        return instruction_load_base_address, class_attribute_offset
 
-                            string_data_label = "d" + str(self.data_label_count)
-                            self.data_label_count += 1
+    def _convert_assignment_to_assembly(
+        self,
+        assignment3node: Assignment3Node,
+        md_args: List[str],
+        liveness_data: Dict[str, List[int]]
+    ) -> "Instruction":
 
-                            if self.debug:
-                                sys.stdout.write("Converting stmt to assembly - MethodCall3 - String.\n")
+        new_instruction: Any
+        store_instruction: Any
+        var_fp_offset: Any
 
-                            instruction_initialise_string_data_assembly_code = string_data_label + \
-                                ": .asciz " + next_arg.value[:-1] + '"' + "\n"
+        if __debug__ and self.debug:
+            sys.stdout.write("Converting stmt to assembly - Assignment\n")
 
-                            instruction_add_string_to_data = Instruction(
-                                instruction=instruction_initialise_string_data_assembly_code
-                            )
+        registers = self._get_registers(
+            assignment3node,
+            liveness_data
+        )
 
-                            self.instruction_data_tail.insert_child(instruction_add_string_to_data)
-                            self.instruction_data_tail = instruction_add_string_to_data
+        required_registers = self._get_required_registers(
+            assignment3node
+        )
 
-                            # No need to update labels because it is a string constant
-                            # that will not be reused
+        if __debug__ and self.debug:
+            sys.stdout.write("Registers obtained: " + str(registers) + \
+                "\n")
 
-                            instruction_load_next_argument = LoadInstruction(
-                                rd=next_arg_reg,
-                                label=string_data_label
-                            )
+        x_is_arg = self._check_if_in_arguments(
+            assignment3node.identifier
+        )
 
-                        if next_arg.type == BasicType.BOOL:
+        if assignment3node.identifier_is_class_attribute:
 
-                            if next_arg.value == 'true':
+            # Manually override with y register for class attribute
+            # Need to guarantee register for base address of object is different
+            # from register for value to assign
+            x_register = registers['y'][0]
 
-                                instruction_load_next_argument = MoveNegateImmediateInstruction(
-                                    rd=next_arg_reg,
-                                    immediate=0
-                                )
+        else:
+            x_register = registers['x'][0]
 
-                            elif next_arg.value == 'false':
+        is_simple_assignment = assignment3node.assigned_value_is_raw_value
 
-                                instruction_load_next_argument = MoveImmediateInstruction(
-                                    rd=next_arg_reg,
-                                    immediate=0
-                                )
+        assignment_handler = self._assignment_handlers.get(
+            type(assignment3node.assigned_value)
+        )
 
-                    else:
+        if is_simple_assignment:
 
-                        if type(next_arg) == ClassAttribute3Node:
-                            if self.debug:
-                                sys.stdout.write("Converting stmt to assembly - MethodCall3 - Class attribute arg detected.\n")
-                            pass
+            if type(assignment3node.assigned_value) is IR3Node:
+                assigned_value = assignment3node.assigned_value.value
 
-                        else:
-                            if self.debug:
-                                sys.stdout.write("Converting stmt to assembly - MethodCall3 - Identifier arg detected: " +
-                                    next_arg.value + "\n")
+            else:
+                assigned_value = assignment3node.assigned_value
 
-                            next_arg_in_reg = self._check_if_in_arguments(
-                                next_arg.value,
-                                md_args
-                            )
+            if assignment3node.type in [BasicType.INT, BasicType.BOOL]:
 
-                            if next_arg_in_reg:
+                if assignment3node.type == BasicType.INT:
 
-                                # Since arguments have been pushed onto the stack,
-                                # retrieve arguments from the stack instead
-                                # with offset from stack pointer
+                    # x = CONSTANT
+                    new_instruction = MoveImmediateInstruction(
+                        rd=x_register,
+                        immediate=assigned_value
+                    )
 
-                                arg_reg_stack_offset = ARG_REGISTER_TO_STACK_OFFSET[next_arg_in_reg]
+                elif assignment3node.type == BasicType.BOOL:
 
-                                instruction_load_next_argument = LoadInstruction(
-                                    rd=next_arg_reg,
-                                    base_offset="sp",
-                                    offset=arg_reg_stack_offset
-                                )
+                    if assigned_value == 'true':
 
-                            else:
+                        new_instruction = MoveNegateImmediateInstruction(
+                            rd=x_register,
+                            immediate=0
+                        )
 
-                                # Otherwise, retrieve arguments from stack
-                                # with offset from frame pointer
+                    elif assigned_value == 'false':
 
-                                var_offset = self.address_descriptor[next_arg.value]['offset']
+                        new_instruction = MoveImmediateInstruction(
+                            rd=x_register,
+                            immediate=0
+                        )
 
-                                instruction_load_next_argument = LoadInstruction(
-                                    rd=next_arg_reg,
-                                    base_offset="fp",
-                                    offset=-var_offset
-                                )
-                        # move to an argument register
+            elif assignment3node.type == BasicType.STRING:
 
-                    arg_count += 1
-                    next_arg = next_arg.child
+                string_data_label = f"d{self.data_label_count}"
+                self.data_label_count += 1
 
-                    self._link_instructions([
-                        latest_instruction_load_argument,
-                        instruction_load_next_argument
-                    ])
+                if __debug__ and self.debug:
+                    sys.stdout.write("Converting assignment to assembly - Raw string: " + \
+                        str(assigned_value) + "\n")
 
-                    latest_instruction_load_argument = instruction_load_next_argument
+                instruction_initialise_string_data_assembly_code = \
+                    f"{string_data_label}: .asciz {assigned_value}\n"
 
-            instruction_load_arguments_last_child = instruction_load_arguments.get_last_child()
+                self.data_lines.append(instruction_initialise_string_data_assembly_code)
 
-            instruction_branch_to_function= BranchLinkInstruction(
-                label=method_call_node.method_id[1:]
-            )
+                self._update_label(
+                    identifier=assignment3node.identifier,
+                    label=string_data_label
+                )
 
-            instruction_move_return_value_to_x_register = MoveRegisterInstruction(
-                rd=x_register,
-                rn="a1"
-            )
+                new_instruction = LoadInstruction(
+                    rd=x_register,
+                    label=string_data_label
+                )
 
-            self._link_instructions([
-                instruction_load_arguments_last_child,
-                instruction_branch_to_function,
-                instruction_move_return_value_to_x_register
-            ])
+            else:
 
-            # Pop argument registers onto the stack to save argument values
-            # in case there are nested function calls
+                if __debug__ and self.debug:
+                    sys.stdout.write("Converting stmt to assembly - Assignment - node type: " + \
+                        str(assignment3node.type) + "\n")
 
-            instruction_save_arg_registers = Instruction(
-                instruction="stmfd sp!,{a1,a2,a3,a4}\n"
-            )
+                new_instruction = Instruction(
+                    instruction="Error in simple assignment.\n"
+                )
 
-            # Restore argument registers from stack to restore argument values
-            # after nested function call
+        elif assignment_handler:
 
-            instruction_pop_arg_registers = Instruction(
-                instruction="ldmfd sp!,{a1,a2,a3,a4}\n"
+            new_instruction = assignment_handler(
+                assignment3node,
+                md_args,
+                registers,
+                x_register
             )
 
-            self._link_instructions([
-                instruction_save_arg_registers,
-                instruction_load_arguments
-            ])
-
-            self._link_instructions([
-                instruction_move_return_value_to_x_register,
-                instruction_pop_arg_registers
-            ])
-
-            new_instruction = instruction_save_arg_registers
-
         else:
 
-            if self.debug:
-                sys.stdout.write("Converting stmt to assembly - Assignment - " + \
-                    "x = y" + "\n")
-
-            # x = y
-
-            y_register = registers['y'][0]
-
-            if self.debug:
-                sys.stdout.write("Converting stmt to assembly - Assignment - " + \
-                    "x = y - y register: " + str(y_register) + "\n")
-                sys.stdout.write("x register: " + str(x_register) + "\n")
-
-            instruction_assign = MoveRegisterInstruction(
-                rd=x_register,
-                rn=y_register
-            )
-
-            # Load y if it is not an argument
-            y_is_arg = self._check_if_in_arguments(
-                assignment3node.assigned_value,
-                md_args
-            )
-
-            if type(assignment3node.assigned_value) == ClassAttribute3Node:
-
-                if assignment3node.assigned_value.object_name == "this":
-
-                    # Load base address into a register
-                    base_address_register = registers['y'][0]
-
-                    instruction_load_base_address = MoveRegisterInstruction(
-                        rd=base_address_register,
-                        rn="a1"
-                    )
-
-                    self._update_descriptors(
-                        register=base_address_register,
-                        identifier="this"
-                    )
-
-                    # Calculate offset of class attribute in object
-
-                    class_attribute_offset = self._calculate_class_attribute_offset(
-                        class_name=assignment3node.assigned_value.class_name,
-                        attribute_name=assignment3node.assigned_value.target_attribute
-                    )
+            if __debug__ and self.debug:
+                sys.stdout.write("Converting stmt to assembly - Assignment - " + \
+                    "x = y" + "\n")
 
-                else:
+            # x = y
 
-                    # Get base address of object
-                    object_address_offset = self.address_descriptor[
-                        assignment3node.assigned_value.object_name
-                    ]['offset']
+            y_register = registers['y'][0]
 
-                    # Load base address into a register
-                    base_address_register = registers['y'][0]
+            if __debug__ and self.debug:
+                sys.stdout.write("Converting stmt to assembly - Assignment - " + \
+                    "x = y - y register: " + str(y_register) + "\n")
+                sys.stdout.write("x register: " + str(x_register) + "\n")
 
-                    instruction_load_base_address = LoadInstruction(
-                        rd=base_address_register,
-                        base_offset="fp",
-                        offset=-object_address_offset
-                    )
+            # The mov from y to x is only built on the paths that emit it,
+            # as a coalesced copy needs none
 
-                    self._update_descriptors(
-                        register=base_address_register,
-                        identifier=assignment3node.assigned_value.object_name
-                    )
+            if type(assignment3node.assigned_value) is ClassAttribute3Node:
 
-                    # Calculate offset of class attribute in object
+                # Load base address into a register and calculate offset of
+                # class attribute in object
+                base_address_register = registers['y'][0]
 
-                    class_attribute_offset = self._calculate_class_attribute_offset(
-                        ir3_node=assignment3node.assigned_value
+                instruction_load_base_address, class_attribute_offset = \
+                    self._load_class_attribute_base_address(
+                        assignment3node.assigned_value,
+                        base_address_register
                     )
 
                 # Generate instruction
@@ -3209,6 +3059,11 @@ class Compiler:
                     identifier=assignment3node.assigned_value.__str__()
                 )
 
+                instruction_assign = MoveRegisterInstruction(
+                    rd=x_register,
+                    rn=y_register
+                )
+
                 self._link_instructions([
                     instruction_load_base_address,
                     instruction_load_class_attribute,
@@ -3217,12 +3072,12 @@ class Compiler:
 
                 new_instruction = instruction_load_base_address
 
-            elif not y_is_arg and not assignment3node.assigned_value_is_raw_value:
+            elif not self._check_if_in_arguments(assignment3node.assigned_value):
 
-                if self.debug:
-                    sys.stdout.write("Testing: " + str(assignment3node.assigned_value_is_raw_value) + "\n")
+                # Load y if it is not an argument. Raw values are handled as
+                # simple assignments, so y is an identifier here.
 
-                var_y_offset = self.address_descriptor[assignment3node.assigned_value]['offset']
+                var_y_offset = self.md_var_offsets[assignment3node.assigned_value]
 
                 new_instruction = LoadInstruction(
                     rd=y_register,
@@ -3235,15 +3090,34 @@ class Compiler:
                     identifier=assignment3node.assigned_value
                 )
 
-                # Assign
+                if not x_is_arg and \
+                    not assignment3node.identifier_is_class_attribute:
 
-                self._link_instructions([
-                    new_instruction,
-                    instruction_assign
-                ])
+                    # Coalesce the copy: x takes over the register y was
+                    # loaded into, so no mov is needed
+
+                    self._discard_register_references(assignment3node.identifier)
+                    x_register = y_register
+
+                else:
+
+                    # Assign
+
+                    instruction_assign = MoveRegisterInstruction(
+                        rd=x_register,
+                        rn=y_register
+                    )
+
+                    self._link_instructions([
+                        new_instruction,
+                        instruction_assign
+                    ])
 
             else:
-                new_instruction = instruction_assign
+                new_instruction = MoveRegisterInstruction(
+                    rd=x_register,
+                    rn=y_register
+                )
 
         # Update descriptor for x if it is not an argument and not a class attribute
 
@@ -3254,143 +3128,79 @@ class Compiler:
                 identifier=assignment3node.identifier
             )
 
-        if self.debug:
+        if __debug__ and self.debug:
             sys.stdout.write("Converting stmt to assembly - Assignment - " + \
                 "Instruction: " + str(new_instruction) + "\n")
 
         if assignment3node.identifier not in REGISTERS and \
             not x_is_arg and \
-            not type(assignment3node.assigned_value) == ClassInstance3Node:
+            type(assignment3node.assigned_value) is not ClassInstance3Node:
 
             # If LHS of assignment is not a register, not an argument, and
             # it is not declaring a new object, then store the value of identifier
             # to stack
 
-            if self.debug:
+            if __debug__ and self.debug:
                 sys.stdout.write("Converting stmt to assembly - updating register x of type: " + \
                     str(type(assignment3node.identifier)) + "\n")
 
             new_instruction_last = new_instruction.get_last_child()
 
-            if self.debug:
+            if __debug__ and self.debug:
                 sys.stdout.write("Converting stmt to assembly - Assignment - " + \
                     "Last instruction: " + str(new_instruction_last) + "\n")
                 sys.stdout.write("Converting stmt to assembly - Storing value of x: " + \
                     str(assignment3node.identifier) + " with type " + \
                     str(type(assignment3node.identifier))+ "\n")
 
-            if type(assignment3node.identifier) == ClassAttribute3Node:
+            if assignment3node.identifier_is_class_attribute:
                 # If class attribute
 
-                if self.debug:
+                if __debug__ and self.debug:
                     sys.stdout.write("Converting stmt to assembly - x is class attribute.\n")
                     sys.stdout.write("Converting stmt to assembly - object name: " + \
                         str(assignment3node.identifier.object_name) + "\n")
 
-                if assignment3node.identifier.object_name == "this":
-
-                    if self.debug:
-                        sys.stdout.write("Converting stmt to assembly - x is this class attribute.\n")
-
-                    # Load base address into a register from the first argument
-                    base_address_register = registers['z'][0]
-
-                    instruction_load_base_address = MoveRegisterInstruction(
-                        rd=base_address_register,
-                        rn="a1"
-                    )
-
-                    # Calculate offset of class attribute in object
-
-                    if self.debug:
-                        sys.stdout.write('Converting stmt to assembly - "this" class type: ' + \
-                            str(assignment3node.identifier.class_name) + "\n")
-
-                    class_attribute_offset = self._calculate_class_attribute_offset(
-                        class_name=assignment3node.identifier.class_name,
-                        attribute_name=assignment3node.identifier.target_attribute
-                    )
-
-                    if self.debug:
-                        sys.stdout.write('Converting stmt to assembly - "this" class type attribute offset: ' + \
-                            str(class_attribute_offset) + "\n")
-
-                    # Generate instruction
-
-                    instruction_store_to_class_attribute = StoreInstruction(
-                        rd=x_register,
-                        base_offset=base_address_register,
-                        offset=class_attribute_offset
-                    )
-
-                    self._link_instructions([
-                        new_instruction_last,
-                        instruction_load_base_address,
-                        instruction_store_to_class_attribute
-                    ])
-
-                    store_instruction = instruction_load_base_address
-
-                else:
-
-                    # Get base address of object
-                    object_address_offset = self.address_descriptor[
-                        assignment3node.identifier.object_name
-                    ]['offset']
-
-                    if self.debug:
-                        sys.stdout.write("Converting stmt to assembly - object base address: " + \
-                            str(object_address_offset) + "\n")
+                # Load base address into a register and calculate offset of
+                # class attribute in object
+                base_address_register = registers['z'][0]
 
-                    # Load base address into a register
-                    base_address_register = registers['z'][0]
-
-                    instruction_load_base_address = LoadInstruction(
-                        rd=base_address_register,
-                        base_offset="fp",
-                        offset=-object_address_offset
-                    )
-
-                    # Calculate offset of class attribute in object
-
-                    class_attribute_offset = self._calculate_class_attribute_offset(
-                        ir3_node=assignment3node.identifier
+                instruction_load_base_address, class_attribute_offset = \
+                    self._load_class_attribute_base_address(
+                        assignment3node.identifier,
+                        base_address_register
                     )
 
-                    if self.debug:
-                        sys.stdout.write("Converting stmt to assembly - class attribute address: " + \
-                            str(class_attribute_offset) + "\n")
-
-                    # Generate instruction
+                # Generate instruction
 
-                    instruction_store_to_class_attribute = StoreInstruction(
-                        rd=x_register,
-                        base_offset=base_address_register,
-                        offset=class_attribute_offset
-                    )
+                instruction_store_to_class_attribute = StoreInstruction(
+                    rd=x_register,
+                    base_offset=base_address_register,
+                    offset=class_attribute_offset
+                )
 
-                    self._link_instructions([
-                        new_instruction_last,
-                        instruction_load_base_address,
-                        instruction_store_to_class_attribute
-                    ])
+                self._link_instructions([
+                    new_instruction_last,
+                    instruction_load_base_address,
+                    instruction_store_to_class_attribute
+                ])
 
-                    store_instruction = instruction_load_base_address
+                store_instruction = instruction_load_base_address
 
             else:
 
                 x_identifier = assignment3node.identifier
                 if x_identifier in self.address_descriptor:
                     # If variable
-                    if self.debug:
+                    if __debug__ and self.debug:
                         sys.stdout.write("Converting stmt to assembly - Assignment" + \
                             " - Variable detected on LHS.\n")
 
 
 
-                    var_fp_offset = self.address_descriptor[x_identifier]['offset']
+                    var_fp_offset = self.md_var_offsets[x_identifier]
 
-                    if self.debug:
+                    if __debug__ and self.debug:
                         sys.stdout.write("Converting stmt to assembly - Storing value of x: " + \
                             str(assignment3node.identifier) + " with type " + \
                             str(type(assignment3node.identifier)) + " in register " + \
@@ -3432,7 +3242,7 @@ class Compiler:
         md_exit_label: str
     ) -> "Instruction":
 
-        if self.debug:
+        if __debug__ and self.debug:
             sys.stdout.write("Converting stmt to assembly - Return.\n")
 
         # Create method exit branch instruction
@@ -3445,18 +3255,17 @@ class Compiler:
 
         return_identifier = ir3_node.return_value
 
-        if self.debug:
+        if __debug__ and self.debug:
             sys.stdout.write("Converting stmt to assembly - Return value: " + \
                 str(ir3_node.return_value) + "\n")
 
 
         return_identifier_reg = self._check_if_in_arguments(
-            ir3_node.return_value,
-            md_args
+            ir3_node.return_value
         )
 
         if return_identifier_reg:
-            if self.debug:
+            if __debug__ and self.debug:
                 sys.stdout.write("Converting return statement to assembly - Already an argument.\n")
 
             instruction_move_to_argument_reg = MoveRegisterInstruction(
@@ -3471,10 +3280,12 @@ class Compiler:
 
             return instruction_move_to_argument_reg
 
-        try:
-            return_identifier_reg = self._check_if_in_register(return_identifier)[0]
+        identifier_in_register = self._check_if_in_register(return_identifier)
+
+        if identifier_in_register:
+            return_identifier_reg = identifier_in_register[0]
 
-            if self.debug:
+            if __debug__ and self.debug:
                 sys.stdout.write("Converting return statement to assembly - Already in register.\n")
 
                 sys.stdout.write("Register descriptors after obtaining identifier in address descriptor: " + \
@@ -3492,20 +3303,13 @@ class Compiler:
 
             return instruction_move_to_argument_reg
 
-        except:
-
-            return_identifier_reg = self._get_registers(
-                ir3_node,
-                md_args,
-                liveness_data
-            )['x'][0]
-
-        # Check if identifier is in address descriptor
-        try:
-            return_identifier_offset = self.address_descriptor[return_identifier]['offset']
+        return_identifier_reg = self._get_registers(
+            ir3_node,
+            liveness_data
+        )['x'][0]
 
-        except:
-            return_identifier_offset = None
+        # Check if identifier has a stack offset
+        return_identifier_offset = self.md_var_offsets.get(return_identifier)
 
         if return_identifier_offset:
 
@@ -3541,7 +3345,7 @@ class Compiler:
 
             current_class = md_args[0][1]
 
-            if self.debug:
+            if __debug__ and self.debug:
                 sys.stdout.write("Converting return statement to assembly - Checking for class attribute: " + \
                     str(ir3_node.return_value) + " in current class: " + str(current_class) + "\n")
 
@@ -3552,7 +3356,7 @@ class Compiler:
                 attribute_name=ir3_node.return_value
             )
 
-            if self.debug:
+            if __debug__ and self.debug:
                 sys.stdout.write("Converting return statement to assembly - Getting offset for class attribute " + \
                     str(ir3_node.return_value) + " in current class: " + str(current_class) + \
                     ": " + str(class_attribute_offset) + "\n")
@@ -3583,165 +3387,263 @@ class Compiler:
 
         registers = self._get_registers(
             ir3_node,
-            md_args,
             liveness_data
         )
 
+        # Load and compare the condition according to its type. The handlers
+        # return the first instruction and the compare, and record the loaded
+        # operands in the descriptors.
+
+        condition_handler = self._if_goto_condition_handlers[
+            type(ir3_node.rel_exp)
+        ]
+
+        instruction_load_y_value, instruction_compare = condition_handler(
+            ir3_node,
+            md_args,
+            registers
+        )
+
+        # Branch on the relational operator, or on the condition being
+        # true for identifiers and attributes
+
+        true_label = f".{ir3_node.goto}"
+
+        instruction_branch_to_true = ConditionalBranchInstruction(
+            operator=ir3_node.rel_exp.operator \
+                if type(ir3_node.rel_exp) is RelOp3Node else "==",
+            label=true_label
+        )
+
+        self._link_instructions([
+            instruction_compare,
+            instruction_branch_to_true
+        ])
+
+        return instruction_load_y_value
+
+    def _compare_if_goto_condition_with_true(
+        self,
+        ir3_node: IfGoTo3Node,
+        instruction_load_y_value: "Instruction",
+        y_reg: str
+    ) -> Tuple["Instruction", "Instruction"]:
+
+        # Shared by identifier and attribute conditions once the condition
+        # is loaded into y. Compare against true (-1) without loading it
+        # into a register.
+
+        instruction_compare = CompareNegativeInstruction(
+            rd=y_reg,
+            immediate=1
+        )
+
+        self._link_instructions([
+            instruction_load_y_value,
+            instruction_compare
+        ])
+
+        self._update_descriptors(y_reg, ir3_node.rel_exp)
+
+        return instruction_load_y_value, instruction_compare
+
+    def _convert_if_goto_identifier_condition_to_assembly(
+        self,
+        ir3_node: IfGoTo3Node,
+        md_args: List[str],
+        registers: Dict[str, Any]
+    ) -> Tuple["Instruction", "Instruction"]:
+
+        if __debug__ and self.debug:
+            sys.stdout.write("Converting if-goto to assembly - Identifier as condition.\n")
+
+        y_reg = registers['y'][0]
+
+        # Load identifier
+
+        var_y_offset = self.md_var_offsets[ir3_node.rel_exp]
+
+        instruction_load_y_value = LoadInstruction(
+            rd=y_reg,
+            base_offset="fp",
+            offset=-var_y_offset
+        )
+
+        return self._compare_if_goto_condition_with_true(
+            ir3_node,
+            instruction_load_y_value,
+            y_reg
+        )
+
+    def _convert_if_goto_attribute_condition_to_assembly(
+        self,
+        ir3_node: IfGoTo3Node,
+        md_args: List[str],
+        registers: Dict[str, Any]
+    ) -> Tuple["Instruction", "Instruction"]:
+
+        if __debug__ and self.debug:
+            sys.stdout.write("Converting if-goto to assembly - Nested identifier as condition.\n")
+            sys.stdout.write("Md args: " + str(md_args) + "\n")
+            sys.stdout.write("Attribute identifier: " +str(ir3_node.rel_exp.value) + "\n")
+
         y_reg = registers['y'][0]
-        z_reg = registers['z'][0]
 
-        if type(ir3_node.rel_exp) == str:
+        # Load identifier
 
-            if self.debug:
-                sys.stdout.write("Converting if-goto to assembly - Identifier as condition.\n")
+        var_y_offset = self._calculate_class_attribute_offset(
+            attribute_name=ir3_node.rel_exp.value,
+            class_name=md_args[0][1]
+        )
 
-            rel_operator = "=="
+        if __debug__ and self.debug:
+            sys.stdout.write("Converting if-goto to assembly - Attribute offset: " +\
+                str(var_y_offset) + "\n")
 
-            # Load identifier
+        if var_y_offset is not None:
 
-            var_y_offset = self.address_descriptor[ir3_node.rel_exp]['offset']
+            if __debug__ and self.debug:
+                sys.stdout.write("Offset found in attribute")
 
             instruction_load_y_value = LoadInstruction(
                 rd=y_reg,
-                base_offset="fp",
-                offset=-var_y_offset
+                base_offset="a1",
+                offset=var_y_offset
             )
 
-            instruction_load_true_value = MoveNegateImmediateInstruction(
-                rd=z_reg,
-                immediate=0
-            )
+        else:
 
-            # Compare
+            var_y_offset = self.md_var_offsets[
+                ir3_node.rel_exp.value
+            ]
 
-            instruction_compare = CompareInstruction(
+            instruction_load_y_value = LoadInstruction(
                 rd=y_reg,
-                rn=z_reg
+                base_offset="fp",
+                offset=-var_y_offset
             )
 
-            self._link_instructions([
-                instruction_load_y_value,
-                instruction_load_true_value,
-                instruction_compare
-            ])
+        if __debug__ and self.debug:
+            sys.stdout.write("Converting if-goto to assembly - Offset: " + \
+                str(var_y_offset) + "\n")
+
+        return self._compare_if_goto_condition_with_true(
+            ir3_node,
+            instruction_load_y_value,
+            y_reg
+        )
 
-        elif type(ir3_node.rel_exp) == IR3Node:
+    def _convert_if_goto_relop_condition_to_assembly(
+        self,
+        ir3_node: IfGoTo3Node,
+        md_args: List[str],
+        registers: Dict[str, Any]
+    ) -> Tuple["Instruction", "Instruction"]:
 
-            if self.debug:
-                sys.stdout.write("Converting if-goto to assembly - Nested identifier as condition.\n")
-                sys.stdout.write("Md args: " + str(md_args) + "\n")
-                sys.stdout.write("Attribute identifier: " +str(ir3_node.rel_exp.value) + "\n")
+        if __debug__ and self.debug:
+            sys.stdout.write("Converting if-goto to assembly - RelOp as condition.\n")
 
-            rel_operator = "=="
+        rel_exp = ir3_node.rel_exp
 
-            # Load identifier
+        y_reg = registers['y'][0]
 
-            var_y_offset = self._calculate_class_attribute_offset(
-                attribute_name=ir3_node.rel_exp.value,
-                class_name=md_args[0][1]
-            )
+        # Load the left operand, moving raw values in directly
 
-            if self.debug:
-                sys.stdout.write("Converting if-goto to assembly - Attribute offset: " +\
-                    str(var_y_offset) + "\n")
+        if rel_exp.left_operand_is_raw_value:
 
-            if type(var_y_offset) == int:
+            y_identifier = 'placeholder'
 
-                if self.debug:
-                    sys.stdout.write("Offset found in attribute")
+            if rel_exp.left_operand == 'true':
 
-                instruction_load_y_value = LoadInstruction(
+                instruction_load_y_value = MoveNegateImmediateInstruction(
                     rd=y_reg,
-                    base_offset="a1",
-                    offset=var_y_offset
+                    immediate=0
                 )
 
             else:
 
-                var_y_offset = self.address_descriptor[
-                    ir3_node.rel_exp.value
-                ]['offset']
-
-                instruction_load_y_value = LoadInstruction(
-                    rd=y_reg,
-                    base_offset="fp",
-                    offset=-var_y_offset
+                y_immediate = self._get_raw_operand_immediate(
+                    rel_exp.left_operand
                 )
 
-            if self.debug:
-                sys.stdout.write("Converting if-goto to assembly - Offset: " + \
-                    str(var_y_offset) + "\n")
+                # The assembler turns a mov of an inverted immediate into mvn
 
-            instruction_load_true_value = MoveNegateImmediateInstruction(
-                rd=z_reg,
-                immediate=0
-            )
+                if self._is_encodable_immediate(y_immediate) or \
+                    self._is_encodable_immediate(~y_immediate):
 
-            # Compare
+                    instruction_load_y_value = MoveImmediateInstruction(
+                        rd=y_reg,
+                        immediate=y_immediate
+                    )
 
-            instruction_compare = CompareInstruction(
-                rd=y_reg,
-                rn=z_reg
-            )
+                else:
 
-            self._link_instructions([
-                instruction_load_y_value,
-                instruction_load_true_value,
-                instruction_compare
-            ])
+                    instruction_load_y_value = LoadInstruction(
+                        rd=y_reg,
+                        label=str(y_immediate)
+                    )
 
-        elif type(ir3_node.rel_exp) == RelOp3Node:
+        else:
 
-            if self.debug:
-                sys.stdout.write("Converting if-goto to assembly - RelOp as condition.\n")
+            y_identifier = rel_exp.left_operand
 
-            # Load identifier
+            instruction_load_y_value = self._load_relop_operand(
+                y_identifier,
+                y_reg
+            )
 
-            var_y_is_arg = self._check_if_in_arguments(
-                ir3_node.rel_exp.left_operand,
-                md_args
+        # Compare raw right operands as an immediate if they can be encoded,
+        # otherwise load them
+
+        if rel_exp.right_operand_is_raw_value:
+            z_immediate = self._get_raw_operand_immediate(
+                rel_exp.right_operand
             )
 
-            if var_y_is_arg:
-                instruction_load_y_value = MoveRegisterInstruction(
+        if rel_exp.right_operand_is_raw_value and \
+            self._is_encodable_immediate(abs(z_immediate)):
+
+            if z_immediate < 0:
+
+                instruction_compare = CompareNegativeInstruction(
                     rd=y_reg,
-                    rn=var_y_is_arg
+                    immediate=-z_immediate
                 )
 
             else:
 
-                var_y_offset = self.address_descriptor[
-                    ir3_node.rel_exp.left_operand
-                ]['offset']
-
-                instruction_load_y_value = LoadInstruction(
+                instruction_compare = CompareInstruction(
                     rd=y_reg,
-                    base_offset="fp",
-                    offset=-var_y_offset
+                    immediate=z_immediate
                 )
 
-            var_z_is_arg = self._check_if_in_arguments(
-                ir3_node.rel_exp.right_operand,
-                md_args
-            )
+            instructions = [
+                instruction_load_y_value,
+                instruction_compare
+            ]
 
-            if var_z_is_arg:
-                instruction_load_z_value = MoveRegisterInstruction(
-                    rd=z_reg,
-                    rn=var_z_is_arg
-                )
+            self._update_descriptors(y_reg, y_identifier)
 
-            else:
+        else:
+
+            z_reg = registers['z'][0]
 
-                var_z_offset = self.address_descriptor[
-                    ir3_node.rel_exp.right_operand
-                ]['offset']
+            if rel_exp.right_operand_is_raw_value:
 
+                z_identifier = 'placeholder'
 
                 instruction_load_z_value = LoadInstruction(
                     rd=z_reg,
-                    base_offset="fp",
-                    offset=-var_z_offset
+                    label=str(z_immediate)
+                )
+
+            else:
+
+                z_identifier = rel_exp.right_operand
+
+                instruction_load_z_value = self._load_relop_operand(
+                    z_identifier,
+                    z_reg
                 )
 
             # Compare
@@ -3751,64 +3653,67 @@ class Compiler:
                 rn=z_reg
             )
 
-            # If true, go to branch to set to True
+            instructions = [
+                instruction_load_y_value,
+                instruction_load_z_value,
+                instruction_compare
+            ]
 
-            rel_operator = "=="
+            self._update_multiple_descriptors((
+                (y_reg, y_identifier),
+                (z_reg, z_identifier),
+            ))
 
-            branch_index = self.branch_count
-            self.branch_count += 1
+        # Operands already held in their registers need no load
 
-            true_branch_label = "." + str(ir3_node.rel_exp.left_operand) + "_" + \
-                str(ir3_node.rel_exp.right_operand) + "_true_" + str(branch_index)
-            exit_branch_label = "." + str(ir3_node.rel_exp.left_operand) + "_" + \
-                str(ir3_node.rel_exp.right_operand) + "_exit_" + str(branch_index)
+        instructions = [
+            instruction for instruction in instructions if instruction
+        ]
 
-            self._link_instructions([
-                instruction_load_y_value,
-                instruction_load_z_value,
-                instruction_compare
-            ])
+        self._link_instructions(instructions)
 
-        # Branch
+        return instructions[0], instruction_compare
 
-        true_label = "." + str(ir3_node.goto)
+    def _get_raw_operand_immediate(
+        self,
+        operand: str
+    ) -> int:
 
-        instruction_branch_to_true = ConditionalBranchInstruction(
-            operator=rel_operator,
-            label=true_label
-        )
+        # Raw operands of relational expressions are integer or boolean
+        # literals, with true held as -1
 
-        self._link_instructions([
-            instruction_compare,
-            instruction_branch_to_true
-        ])
+        if operand == 'true':
+            return -1
 
-        if type(ir3_node.rel_exp) == RelOp3Node:
-            self._update_descriptors(
-                register=y_reg,
-                identifier=ir3_node.rel_exp.left_operand
-            )
-            self._update_descriptors(
-                register=z_reg,
-                identifier=ir3_node.rel_exp.right_operand
-            )
+        elif operand == 'false':
+            return 0
 
-        else:
-            self._update_descriptors(
-                register=y_reg,
-                identifier=ir3_node.rel_exp
-            )
-            self._update_descriptors(
-                register=z_reg,
-                identifier='placeholder'
-            )
+        return int(operand)
 
-        return instruction_load_y_value
+    def _is_encodable_immediate(
+        self,
+        value: int
+    ) -> bool:
+
+        # Data processing instructions take an 8 bit value rotated right by
+        # an even number of bits as an immediate
+
+        value &= 0xFFFFFFFF
+
+        for rotation in range(0, 32, 2):
+
+            rotated_value = (value << rotation | value >> (32 - rotation)) \
+                & 0xFFFFFFFF
+
+            if rotated_value <= 0xFF:
+                return True
+
+        return False
 
     def _peephole_optimize_assembly(self) -> None:
 
-        self.peephole_optimizer.peephole_optimize_assembly_pass(
-            self.instruction_head
+        self.instructions = self.peephole_optimizer.peephole_optimize_assembly_pass(
+            self.instructions
         )
 
         if self.verbose:
@@ -3832,12 +3737,12 @@ class Compiler:
         """
         self.ir3_generator.generate_ir3(f)
 
-        if self.debug:
+        if __debug__ and self.debug:
             sys.stdout.write("Optimisation - Generating control flow.\n")
 
         self._generate_control_flow(self.ir3_generator.ir3_tree)
 
-        if self.debug:
+        if __debug__ and self.debug:
             sys.stdout.write("Optimisation - Control flow generated.\n")
 
 
@@ -3850,27 +3755,34 @@ class Compiler:
         self._write_to_assembly_file()
 
     def _pretty_print(self) -> None:
-        self.instruction_head.pretty_print()
+
+        for data_line in self.data_lines:
+            sys.stdout.write(data_line)
+
+        for current_instruction in self.instructions:
+            current_instruction.pretty_print()
 
     def _write_to_assembly_file(self) -> None:
 
-        f = open("program.s", "w")
+        # Collect the output and write it once rather than once per line
 
-        completed = False
-        current_instruction = self.instruction_head
+        output = []
+        append_output = output.append
 
-        while not completed:
+        for data_line in self.data_lines:
+            append_output(data_line)
+            append_output("\n")
 
-            if not current_instruction:
-                completed = True
-                break
+        for current_instruction in self.instructions:
 
-            if type(current_instruction) == LabelInstruction:
-                f.write("\n")
+            if type(current_instruction) is LabelInstruction:
+                append_output("\n")
 
-            f.write(current_instruction.__str__())
-            f.write("\n")
-            current_instruction = current_instruction.child
+            append_output(current_instruction.__str__())
+            append_output("\n")
+
+        with open("program.s", "w") as f:
+            f.write("".join(output))
 
     def compile(
         self,
@@ -1502,7 +1502,63 @@ class IR3Generator:
                 sys.stdout.write("Getting Exp - "
                     "NegationNode or ComplementNode detected.\n")
 
-            if isinstance(ast_node, NegationNode):
+            if isinstance(ast_node, NegationNode) and \
+                type(ast_node.negated_expression) == ASTNode and \
+                not ast_node.negated_expression.is_identifier:
+
+                # Short circuit if the negated expression is a constant
+
+                if self.debug:
+                    sys.stdout.write("Getting Exp - NegationNode - "
+                        "Constant short circuit.\n")
+
+                temp_var = "_t"+str(self._get_temp_var_count())
+                temp_var_node = VarDecl3Node(
+                    value=temp_var,
+                    type=BasicType.INT
+                )
+
+                symbol_table.insert(temp_var, BasicType.INT)
+
+                temp_var_assignment_node = Assignment3Node(
+                    type=BasicType.INT
+                )
+                temp_var_assignment_node.set_identifier(temp_var)
+                temp_var_assignment_node.set_assigned_value(
+                    str(-int(ast_node.negated_expression.value)),
+                    assigned_value_is_raw_value=True
+                )
+
+                temp_var_node.add_child(temp_var_assignment_node)
+                return temp_var_node
+
+            elif isinstance(ast_node, ComplementNode) and \
+                type(ast_node.complement_expression) == ASTNode and \
+                not ast_node.complement_expression.is_identifier:
+
+                # Short circuit if the complemented expression is a constant
+
+                if self.debug:
+                    sys.stdout.write("Getting Exp - ComplementNode - "
+                        "Constant short circuit.\n")
+
+                temp_var = "_t"+str(self._get_temp_var_count())
+                temp_var_node = VarDecl3Node(value=temp_var, type=BasicType.BOOL)
+
+                symbol_table.insert(temp_var, BasicType.BOOL)
+
+                temp_var_assignment_node = Assignment3Node(type=BasicType.BOOL)
+                temp_var_assignment_node.set_identifier(temp_var)
+                temp_var_assignment_node.set_assigned_value(
+                    "false" if ast_node.complement_expression.value == "true" \
+                        else "true",
+                    assigned_value_is_raw_value=True
+                )
+
+                temp_var_node.add_child(temp_var_assignment_node)
+                return temp_var_node
+
+            elif isinstance(ast_node, NegationNode):
 
                 negated_exp_node = self._get_exp3(
                     symbol_table,
@@ -1,5 +1,9 @@
 import sys
 
+from functools import (
+    lru_cache,
+)
+
 from typing import (
     Optional,
 )
@@ -12,6 +16,17 @@ DUAL_OP = {
     '&&': 'and ',
 }
 
+# Bound format methods for the register and immediate forms of each dual
+# operand instruction, built once rather than concatenated per render
+DUAL_OP_REGISTER_FORMAT = {
+    operator: (mnemonic + "{},{},{}").format
+    for operator, mnemonic in DUAL_OP.items()
+}
+DUAL_OP_IMMEDIATE_FORMAT = {
+    operator: (mnemonic + "{},{},#{}").format
+    for operator, mnemonic in DUAL_OP.items()
+}
+
 REL_OP = {
     '>': 'bgt ',
     '>=': 'bge ',
@@ -21,8 +36,59 @@ REL_OP = {
     '!=': 'bne '
 }
 
+# Fixed snippets shared by every call site that saves and restores the
+# argument registers around a nested call
+SAVE_ARG_REGISTERS = "stmfd sp!,{a1,a2,a3,a4}\n"
+RESTORE_ARG_REGISTERS = "ldmfd sp!,{a1,a2,a3,a4}\n"
+
+# Method prologue and epilogue saving and restoring the callee-saved
+# registers, frame pointer and return address
+PUSH_CALLEE_SAVED_REGISTERS = "stmfd sp!,{v1,v2,v3,v4,v5,fp,lr}\n"
+POP_CALLEE_SAVED_REGISTERS = "ldmfd sp!,{v1,v2,v3,v4,v5,fp,pc}\n"
+
+@lru_cache(maxsize=None)
+def _format_memory_access(
+    mnemonic: str,
+    rd: str,
+    label: Optional[str],
+    base_offset: Optional[str],
+    offset: Optional[int]
+) -> str:
+
+    # Loads and stores repeat the same few registers and stack offsets, and
+    # the peephole pass renders them more than once, so cache the text
+
+    result = mnemonic + rd + ","
+
+    if label:
+        result += "=" + label
+
+    elif base_offset:
+
+        result += "[" + str(base_offset)
+
+        if offset:
+            result += ",#" + str(offset) + "]"
+        else:
+            result += "]"
+
+    return result
+
 class Instruction:
 
+    __slots__ = (
+        'line_no',
+        'parent',
+        'child',
+        'assembly_code',
+        'rd',
+        'rm',
+        'rn',
+        'immediate',
+        'offset',
+        'base_offset',
+    )
+
     line_no: Optional[int]
     parent: Optional["Instruction"]
     child: Optional["Instruction"]
@@ -87,10 +153,12 @@ class Instruction:
         self.parent = instruction
 
     def get_last_child(self) -> "Instruction":
-        if not self.child:
-            return self
+        last_child = self
+
+        while last_child.child:
+            last_child = last_child.child
 
-        return self.child.get_last_child()
+        return last_child
 
     def pretty_print(self) -> None:
 
@@ -102,15 +170,14 @@ class Instruction:
             sys.stdout.write(self.__str__())
             sys.stdout.write("\n")
 
-        if self.child:
-            self.child.pretty_print()
-
     def __str__(self) -> str:
 
         return self.assembly_code
 
 class LabelInstruction(Instruction):
 
+    __slots__ = ('label',)
+
     label: str
 
     def __init__(
@@ -134,11 +201,10 @@ class LabelInstruction(Instruction):
         sys.stdout.write(self.__str__())
         sys.stdout.write("\n")
 
-        if self.child:
-            self.child.pretty_print()
-
 class BranchInstruction(Instruction):
 
+    __slots__ = ('label',)
+
     label: str
 
     def __init__(
@@ -152,6 +218,8 @@ class BranchInstruction(Instruction):
 
 class UnconditionalBranchInstruction(BranchInstruction):
 
+    __slots__ = ()
+
     def __init__(
         self,
         *args,
@@ -166,7 +234,10 @@ class UnconditionalBranchInstruction(BranchInstruction):
 
 class ConditionalBranchInstruction(BranchInstruction):
 
+    __slots__ = ('operator', 'mnemonic')
+
     operator: str
+    mnemonic: str
 
     def __init__(
         self,
@@ -177,13 +248,19 @@ class ConditionalBranchInstruction(BranchInstruction):
         super().__init__(*args, **kwargs)
         self.operator = operator
 
+        # The operator does not change once the branch is built, so resolve
+        # its mnemonic once rather than on every render
+        self.mnemonic = REL_OP[operator]
+
     def __str__(self) -> str:
 
-        result = REL_OP[self.operator] + self.label
+        result = self.mnemonic + self.label
         return result
 
 class BranchLinkInstruction(BranchInstruction):
 
+    __slots__ = ()
+
     def __init__(
         self,
         *args,
@@ -198,6 +275,8 @@ class BranchLinkInstruction(BranchInstruction):
 
 class LoadInstruction(Instruction):
 
+    __slots__ = ('label',)
+
     rd: str
     label: Optional[str]
 
@@ -212,24 +291,18 @@ class LoadInstruction(Instruction):
 
     def __str__(self) -> str:
 
-        result = "ldr " + self.rd + ","
-
-        if self.label:
-            result += "=" + self.label
-
-        elif self.base_offset:
-
-            result += "[" + str(self.base_offset)
-
-            if self.offset:
-                result += ",#" + str(self.offset) + "]"
-            else:
-                result += "]"
-
-        return result
+        return _format_memory_access(
+            "ldr ",
+            self.rd,
+            self.label,
+            self.base_offset,
+            self.offset
+        )
 
 class StoreInstruction(Instruction):
 
+    __slots__ = ('label',)
+
     rd: str
     label: Optional[str]
 
@@ -244,28 +317,24 @@ class StoreInstruction(Instruction):
 
     def __str__(self) -> str:
 
-        result = "str " + self.rd + ","
-
-        if self.label:
-            result += "=" + self.label
-
-        elif self.base_offset:
-
-            result += "[" + str(self.base_offset)
-
-            if self.offset:
-                result += ",#" + str(self.offset) + "]"
-            else:
-                result += "]"
-
-        return result
+        return _format_memory_access(
+            "str ",
+            self.rd,
+            self.label,
+            self.base_offset,
+            self.offset
+        )
 
 class MoveInstruction(Instruction):
 
+    __slots__ = ()
+
     pass
 
 class MoveImmediateInstruction(MoveInstruction):
 
+    __slots__ = ()
+
     rd: str
     immediate: int
 
@@ -284,6 +353,8 @@ class MoveImmediateInstruction(MoveInstruction):
 
 class MoveNegateInstruction(MoveInstruction):
 
+    __slots__ = ()
+
     rd: str
     rn: str
 
@@ -301,6 +372,8 @@ class MoveNegateInstruction(MoveInstruction):
 
 class MoveNegateImmediateInstruction(MoveInstruction):
 
+    __slots__ = ()
+
     rd: str
     immediate: int
 
@@ -319,6 +392,8 @@ class MoveNegateImmediateInstruction(MoveInstruction):
 
 class MoveRegisterInstruction(MoveInstruction):
 
+    __slots__ = ()
+
     rd: str
     rn: str
 
@@ -337,6 +412,8 @@ class MoveRegisterInstruction(MoveInstruction):
 
 class CompareInstruction(Instruction):
 
+    __slots__ = ()
+
     rd: str
 
     def __init__(
@@ -356,8 +433,30 @@ class CompareInstruction(Instruction):
 
         return result
 
+class CompareNegativeInstruction(Instruction):
+
+    __slots__ = ()
+
+    rd: str
+    immediate: int
+
+    def __init__(
+        self,
+        *args,
+        **kwargs
+    ) -> None:
+        super().__init__(*args, **kwargs)
+
+    def __str__(self) -> str:
+
+        result = "cmn " + self.rd + ",#" + str(self.immediate)
+
+        return result
+
 class DualOpInstruction(Instruction):
 
+    __slots__ = ('operator',)
+
     operator: str
     rd: str
     rn: str
@@ -373,18 +472,26 @@ class DualOpInstruction(Instruction):
 
     def __str__(self) -> str:
 
-        operator = DUAL_OP[self.operator]
-
         if self.rm:
-            result = operator + self.rd + "," + self.rn + "," + self.rm
+            result = DUAL_OP_REGISTER_FORMAT[self.operator](
+                self.rd,
+                self.rn,
+                self.rm
+            )
 
         elif self.immediate:
-            result = operator + self.rd + "," + self.rn + ",#" + str(self.immediate)
+            result = DUAL_OP_IMMEDIATE_FORMAT[self.operator](
+                self.rd,
+                self.rn,
+                self.immediate
+            )
 
         return result
 
 class NegationInstruction(Instruction):
 
+    __slots__ = ()
+
     rd: str
     rn: str
 
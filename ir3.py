@@ -37,6 +37,16 @@ class IR3Node:
 
     """
 
+    __slots__ = (
+        'value',
+        'type',
+        'md_line_no',
+        'md_basic_block_line_no',
+        'md_basic_block_no',
+        'child',
+        'is_raw_value',
+    )
+
     value: str
     type: Any
     #is_identifier: bool
@@ -111,6 +121,8 @@ class IR3Node:
 
 class Program3Node(IR3Node):
 
+    __slots__ = ('class_data', 'method_data')
+
     class_data: Any
     method_data: Any
 
@@ -141,6 +153,8 @@ class Program3Node(IR3Node):
 
 class CData3Node(IR3Node):
 
+    __slots__ = ('class_name', 'var_decl')
+
     class_name: str
     var_decl: Any
 
@@ -185,6 +199,14 @@ class CData3Node(IR3Node):
 
 class CMtd3Node(IR3Node):
 
+    __slots__ = (
+        'return_type',
+        'method_id',
+        'arguments',
+        'variable_declarations',
+        'statements',
+    )
+
     return_type: Any
     method_id: str
     arguments: Any
@@ -255,6 +277,8 @@ class CMtd3Node(IR3Node):
 
 class VarDecl3Node(IR3Node):
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
 
@@ -274,6 +298,8 @@ class VarDecl3Node(IR3Node):
 
 class Arg3Node(IR3Node):
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
 
@@ -295,6 +321,8 @@ class Arg3Node(IR3Node):
 
 class Label3Node(IR3Node):
 
+    __slots__ = ('label_id',)
+
     label_id: int
 
     def __init__(self, label_id: int, *args, **kwargs) -> None:
@@ -310,6 +338,8 @@ class Label3Node(IR3Node):
 
 class IfGoTo3Node(IR3Node):
 
+    __slots__ = ('rel_exp', 'goto')
+
     rel_exp: Any
     goto: int
 
@@ -334,6 +364,8 @@ class IfGoTo3Node(IR3Node):
 
 class GoTo3Node(IR3Node):
 
+    __slots__ = ('goto',)
+
     goto: int
 
     def __init__(self, goto: int, *args, **kwargs) -> None:
@@ -349,6 +381,8 @@ class GoTo3Node(IR3Node):
 
 class ReadLn3Node(IR3Node):
 
+    __slots__ = ('id3',)
+
     id3: Any
 
     def __init__(self, id3: str, *args, **kwargs) -> None:
@@ -369,6 +403,8 @@ class ReadLn3Node(IR3Node):
 
 class PrintLn3Node(IR3Node):
 
+    __slots__ = ('expression',)
+
     expression: str
 
     def __init__(self, expression: str, *args, **kwargs) -> None:
@@ -388,6 +424,8 @@ class PrintLn3Node(IR3Node):
 
 class ClassInstance3Node(IR3Node):
 
+    __slots__ = ('target_class',)
+
     target_class: str
 
     def __init__(self, target_class: str, *args, **kwargs) -> None:
@@ -403,6 +441,12 @@ class ClassInstance3Node(IR3Node):
 
 class ClassAttribute3Node(IR3Node):
 
+    __slots__ = (
+        'object_name',
+        'target_attribute',
+        'class_name',
+    )
+
     object_name: str
     target_attribute: str
     class_name: str
@@ -434,18 +478,29 @@ class ClassAttribute3Node(IR3Node):
 
 class Assignment3Node(IR3Node):
 
+    __slots__ = (
+        'identifier',
+        'identifier_is_class_attribute',
+        'assigned_value',
+        'assigned_value_is_raw_value',
+    )
+
     identifier: Any
+    identifier_is_class_attribute: bool
     assigned_value: Any
     assigned_value_is_raw_value: bool
 
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
         self.identifier = None
+        self.identifier_is_class_attribute = False
         self.assigned_value = None
         self.assigned_value_is_raw_value = False
 
     def set_identifier(self, identifier: Any) -> None:
         self.identifier = identifier
+        self.identifier_is_class_attribute = \
+            type(identifier) is ClassAttribute3Node
 
     def set_assigned_value(
         self,
@@ -477,6 +532,12 @@ class Assignment3Node(IR3Node):
 
 class MethodCall3Node(IR3Node):
 
+    __slots__ = (
+        'method_id',
+        'arguments',
+        'return_type',
+    )
+
     method_id: str
     arguments: Any
     return_type: Any
@@ -513,6 +574,8 @@ class MethodCall3Node(IR3Node):
 
 class Return3Node(IR3Node):
 
+    __slots__ = ('return_value',)
+
     return_value: Any
 
     def __init__(self, return_value: Any=None, *args, **kwargs) -> None:
@@ -534,6 +597,14 @@ class Return3Node(IR3Node):
 
 class RelOp3Node(IR3Node):
 
+    __slots__ = (
+        'left_operand',
+        'right_operand',
+        'operator',
+        'left_operand_is_raw_value',
+        'right_operand_is_raw_value',
+    )
+
     left_operand: Any
     right_operand: Any
     operator: str
@@ -569,6 +640,14 @@ class RelOp3Node(IR3Node):
 
 class BinOp3Node(IR3Node):
 
+    __slots__ = (
+        'left_operand',
+        'right_operand',
+        'operator',
+        'left_operand_is_raw_value',
+        'right_operand_is_raw_value',
+    )
+
     left_operand: Any
     right_operand: Any
     operator: str
@@ -625,6 +704,8 @@ class BinOp3Node(IR3Node):
 
 class UnaryOp3Node(IR3Node):
 
+    __slots__ = ('operand', 'operator')
+
     operand: Any
     operator: str
 
@@ -648,6 +729,8 @@ class UnaryOp3Node(IR3Node):
 
 class IR3Tree:
 
+    __slots__ = ('head',)
+
     head: Any
 
     def __init__(self, head: Any) -> None:
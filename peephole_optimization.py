@@ -1,7 +1,8 @@
 import sys
 
 from typing import (
-    Tuple,
+    List,
+    Optional,
 )
 
 from ir3 import (
@@ -17,6 +18,8 @@ from instruction import (
     LoadInstruction,
     StoreInstruction,
     UnconditionalBranchInstruction,
+    SAVE_ARG_REGISTERS,
+    RESTORE_ARG_REGISTERS,
 )
 
 class PeepholeOptimizer:
@@ -30,176 +33,173 @@ class PeepholeOptimizer:
 
         self.debug = debug
 
-    def _eliminate_redundant_ldr_str(
+    def _is_redundant_ldr_str(
         self,
         current_instruction: "Instruction",
-        previous_instruction: "Instruction",
-        previous_instruction_parent: "Instruction",
-    ) -> Tuple["Instruction", "Instruction", "Instruction"]:
+        previous_instruction: Optional["Instruction"],
+        previous_instruction_parent: Optional["Instruction"]
+    ) -> bool:
 
-        if (type(current_instruction) == LoadInstruction and \
-            type(previous_instruction) == StoreInstruction and \
+        # Both patterns end in a load, so rule out everything else with a
+        # single identity check before comparing the preceding instructions
+        if type(current_instruction) is not LoadInstruction:
+            return False
+
+        previous_instruction_type = type(previous_instruction)
+
+        if (previous_instruction_type is StoreInstruction and \
             current_instruction.__str__()[3:] == previous_instruction.__str__()[3:]) or \
-            (type(current_instruction) == LoadInstruction and \
-            type(previous_instruction) == LoadInstruction and \
-            type(previous_instruction_parent) == StoreInstruction and \
+            (previous_instruction_type is LoadInstruction and \
+            type(previous_instruction_parent) is StoreInstruction and \
             current_instruction.__str__()[3:] == previous_instruction_parent.__str__()[3:]):
 
             # Check for immediate load stores
 
-            if self.debug:
+            if __debug__ and self.debug:
                 sys.stdout.write("Peephole optimisation - Redundant immediate ldr str detected.\n")
 
-            # Link previous instruction to the child of current instruction
+            return True
 
-            next_instruction = current_instruction.child
+        return False
 
-            previous_instruction.set_child(next_instruction)
-            next_instruction.set_parent(previous_instruction)
-            current_instruction = next_instruction
-            previous_instruction_parent = previous_instruction
+    def _is_redundant_ldm_stm_of_args(
+        self,
+        current_instruction: "Instruction",
+        previous_instruction: Optional["Instruction"]
+    ) -> bool:
 
-        elif current_instruction.assembly_code == 'stmfd sp!,{a1,a2,a3,a4}\n' and \
-            previous_instruction.assembly_code == 'ldmfd sp!,{a1,a2,a3,a4}\n':
+        if previous_instruction and \
+            current_instruction.assembly_code == SAVE_ARG_REGISTERS and \
+            previous_instruction.assembly_code == RESTORE_ARG_REGISTERS:
 
-            if self.debug:
+            if __debug__ and self.debug:
                 sys.stdout.write("Peephole optimisation - Redundant ldr str of args detected.\n")
 
-            previous_instruction_parent.set_child(current_instruction.child)
-            current_instruction.child.set_parent(previous_instruction_parent)
-
-            current_instruction = current_instruction.child
-
-            return (
-                current_instruction,
-                previous_instruction_parent,
-                previous_instruction_parent.parent
-            )
-
-        else:
-            previous_instruction_parent = previous_instruction
-
-        previous_instruction = current_instruction
-        current_instruction = current_instruction.child
+            return True
 
-        return (
-            current_instruction,
-            previous_instruction,
-            previous_instruction_parent
-        )
+        return False
 
-    def _eliminate_redundant_mov(
+    def _is_redundant_mov(
         self,
         instruction: "Instruction"
-    ) -> "Instruction":
+    ) -> bool:
 
-        if type(instruction) == MoveRegisterInstruction and \
-            instruction.rd == instruction.rn:
+        return type(instruction) is MoveRegisterInstruction and \
+            instruction.rd == instruction.rn
 
-            current_instruction_parent = instruction.parent
-            current_instruction_child = instruction.child
-
-            current_instruction_parent.set_child(current_instruction_child)
-            current_instruction_child.set_parent(current_instruction_parent)
-
-            return current_instruction_child
-
-        return instruction
-
-    def _eliminate_unreachable_post_branch(
+    def _is_unreachable_post_branch(
         self,
         current_instruction: "Instruction",
-        previous_instruction: "Instruction"
-    ) -> "Instruction":
+        previous_instruction: Optional["Instruction"]
+    ) -> bool:
 
-        if type(previous_instruction) == UnconditionalBranchInstruction and \
-            type(current_instruction) != LabelInstruction:
+        if type(previous_instruction) is UnconditionalBranchInstruction and \
+            type(current_instruction) is not LabelInstruction:
 
-            current_instruction_child = current_instruction.child
-
-            previous_instruction.set_child(current_instruction_child)
-            current_instruction_child.set_parent(previous_instruction)
-
-            if self.debug:
+            if __debug__ and self.debug:
                 sys.stdout.write("Peephole optimisation - Unreachable instruction detected.\n")
                 sys.stdout.write("Previous instruction: " + previous_instruction.__str__() + "\n")
                 sys.stdout.write("Current instruction: " + current_instruction.__str__() + "\n")
 
-            return current_instruction_child
+            return True
 
-        return current_instruction
+        return False
 
-    def _eliminate_jump_to_next_instruction(
+    def _is_jump_to_next_instruction(
         self,
         current_instruction: "Instruction",
-        previous_instruction: "Instruction",
-        previous_instruction_parent: "Instruction"
-    ) -> Tuple["Instruction", "Instruction"]:
+        previous_instruction: Optional["Instruction"]
+    ) -> bool:
 
-        if type(previous_instruction) == UnconditionalBranchInstruction:
+        if type(previous_instruction) is UnconditionalBranchInstruction:
 
-            if type(current_instruction) == LabelInstruction:
+            if type(current_instruction) is LabelInstruction:
 
-                if self.debug:
+                if __debug__ and self.debug:
                     sys.stdout.write("Peephole optimisation: checking for jump: \n")
                     sys.stdout.write("Previous instruction: " + \
                         previous_instruction.__str__())
                     sys.stdout.write("Current instruction: " + \
                         current_instruction.__str__() + "\n")
 
-
                 if previous_instruction.label == current_instruction.label:
 
-                    previous_instruction_parent.set_child(current_instruction)
-                    current_instruction.set_parent(previous_instruction_parent)
-
-                    previous_instruction = previous_instruction_parent
-                    previous_instruction_parent = previous_instruction_parent.parent
-
-                    if self.debug:
+                    if __debug__ and self.debug:
                         sys.stdout.write("Peephole optimisation - Jump to next instruction detected.\n")
 
-        return (
-            previous_instruction,
-            previous_instruction_parent
-        )
+                    return True
+
+        return False
 
     def peephole_optimize_assembly_pass(
         self,
-        instruction_head: "Instruction"
-    ) -> None:
+        instructions: List["Instruction"]
+    ) -> List["Instruction"]:
+
+        # Single forward pass over the instructions. Kept instructions are
+        # collected in order, so the last two entries are the previous
+        # instruction and its parent for the rules below.
+
+        optimized_instructions = []
 
-        completed = False
-        current_instruction = instruction_head
-        previous_instruction = instruction_head
-        previous_instruction_parent = instruction_head
+        instruction_count = len(instructions)
+        i = 0
 
-        while not completed:
+        while i < instruction_count:
 
-            if not current_instruction:
-                completed = True
-                break
+            if self._is_redundant_mov(instructions[i]):
+                i += 1
+
+                if i >= instruction_count:
+                    break
+
+            previous_instruction = optimized_instructions[-1] \
+                if optimized_instructions else None
+
+            if self._is_unreachable_post_branch(
+                instructions[i],
+                previous_instruction
+            ):
+                i += 1
 
-            current_instruction = self._eliminate_redundant_mov(
-                current_instruction
-            )
+                if i >= instruction_count:
+                    break
 
-            current_instruction = self._eliminate_unreachable_post_branch(
+            current_instruction = instructions[i]
+
+            if self._is_jump_to_next_instruction(
                 current_instruction,
                 previous_instruction
-            )
+            ):
+                optimized_instructions.pop()
+
+            previous_instruction = optimized_instructions[-1] \
+                if optimized_instructions else None
+            previous_instruction_parent = optimized_instructions[-2] \
+                if len(optimized_instructions) > 1 else previous_instruction
 
-            previous_instruction, \
-            previous_instruction_parent = self._eliminate_jump_to_next_instruction(
+            if self._is_redundant_ldr_str(
                 current_instruction,
                 previous_instruction,
                 previous_instruction_parent
-            )
+            ):
+                # Drop the load and keep the following instruction as is
+                i += 1
 
-            current_instruction, \
-            previous_instruction, \
-            previous_instruction_parent = self._eliminate_redundant_ldr_str(
+                if i < instruction_count:
+                    optimized_instructions.append(instructions[i])
+                    i += 1
+
+            elif self._is_redundant_ldm_stm_of_args(
                 current_instruction,
-                previous_instruction,
-                previous_instruction_parent
-            )
+                previous_instruction
+            ):
+                # Drop both the restore and the save of the arguments
+                optimized_instructions.pop()
+                i += 1
+
+            else:
+                optimized_instructions.append(current_instruction)
+                i += 1
+
+        return optimized_instructions